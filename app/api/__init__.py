@@ -1,5 +1,5 @@
 """API routes package."""
 
-from .routes import weather_router, validation_router
+from .routes import weather_router, crops_router, knowledge_router, validation_router
 
-__all__ = ['weather_router', 'validation_router']
+__all__ = ['weather_router', 'crops_router', 'knowledge_router', 'validation_router']
@@ -0,0 +1,51 @@
+"""Request-body parsing that validates raw JSON in a single pydantic pass."""
+from typing import Any, Dict
+
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
+
+
+def _adapter(schema: Any) -> TypeAdapter:
+    return schema if isinstance(schema, TypeAdapter) else TypeAdapter(schema)
+
+
+def json_body(schema: Any):
+    """
+    Dependency that validates the raw request body straight into schema.
+
+    schema is a model class or a prebuilt TypeAdapter. Skips FastAPI's
+    json.loads + dict validation pass in favour of pydantic's validate_json.
+    Errors are still reported as 422s under "body".
+    """
+    adapter = _adapter(schema)
+
+    async def parse(request: Request) -> Any:
+        try:
+            return adapter.validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError([
+                {**error, "loc": ("body", *error["loc"])}
+                for error in e.errors(include_url=False)
+            ])
+    return parse
+
+
+def body_doc(schema: Any) -> Dict[str, Any]:
+    """OpenAPI requestBody for routes that read the body via json_body."""
+    schema = _adapter(schema).json_schema()
+    defs = schema.pop("$defs", {})
+
+    def inline(node):
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return inline(defs[node["$ref"].rsplit("/", 1)[-1]])
+            return {k: inline(v) for k, v in node.items()}
+        if isinstance(node, list):
+            return [inline(v) for v in node]
+        return node
+
+    return {"requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": inline(schema)}}
+    }}
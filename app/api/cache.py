@@ -0,0 +1,42 @@
+"""Response caching for idempotent GET routes."""
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable
+
+from fastapi import HTTPException
+
+from app.config import get_settings
+from app.core.cache import TTLCache
+
+settings = get_settings()
+
+response_cache = TTLCache(maxsize=settings.RESPONSE_CACHE_SIZE)
+
+_MISS = object()
+
+
+def cached(expire: int, key_builder: Callable[[Dict[str, Any]], Hashable]):
+    """
+    Cache a route's response for `expire` seconds under the key built from its kwargs.
+
+    Upstream 5xx failures are cached for ERROR_CACHE_TTL seconds so a failing
+    provider is not hammered by every retrying client.
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = key_builder(kwargs)
+            hit = response_cache.get(key, _MISS)
+            if hit is not _MISS:
+                if isinstance(hit, HTTPException):
+                    raise hit
+                return hit
+            try:
+                result = await func(*args, **kwargs)
+            except HTTPException as e:
+                if e.status_code >= 500:
+                    response_cache.set(key, e, settings.ERROR_CACHE_TTL)
+                raise
+            response_cache.set(key, result, expire)
+            return result
+        return wrapper
+    return decorator
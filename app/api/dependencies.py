@@ -0,0 +1,44 @@
+"""Request-scoped dependencies shared by the API routers."""
+from fastapi import HTTPException, Path, Request
+
+from app.core.agent.interface import MCPAgentInterface
+from app.core.models.location import GeoLocation
+from app.core.services import (
+    CropManagementService, KnowledgeBaseService, WeatherService
+)
+
+
+def get_weather_service(request: Request) -> WeatherService:
+    """Return the app's WeatherService, bound to the pooled HTTP client."""
+    return request.app.state.services.weather
+
+
+def get_crop_service(request: Request) -> CropManagementService:
+    """Return the app's CropManagementService, sharing the WeatherService."""
+    return request.app.state.services.crop
+
+
+def get_knowledge_service(request: Request) -> KnowledgeBaseService:
+    """Return the app's KnowledgeBaseService."""
+    return request.app.state.services.knowledge
+
+
+def get_agent_interface(request: Request) -> MCPAgentInterface:
+    """Return the stateless agent interface shared across the app."""
+    return request.app.state.agent_interface
+
+
+class LocationParam:
+    """Parse a 'latitude,longitude' path segment into a GeoLocation once per request."""
+
+    def __init__(
+        self,
+        location_id: str = Path(...,
+                                description="Location ID in format 'latitude,longitude'")
+    ):
+        try:
+            lat, lon = location_id.split(',')
+            self.location = GeoLocation(latitude=float(lat), longitude=float(lon))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid location format")
+        self.location_id = location_id
@@ -1,66 +1,83 @@
-from fastapi import APIRouter, Depends
-from typing import List
+from fastapi import APIRouter, Depends, Request
+from typing import Any, Dict, List
+import asyncio
 
+from app.api.body import body_doc, json_body
+from app.api.dependencies import get_agent_interface
 from app.core.agent.interface import (
     MCPAgentInterface,
     AgentContext,
+    AgentQuery,
     AgentResponse,
-    CropManagementQuery,
-    SoilAnalysisQuery,
-    PestControlQuery,
-    IrrigationScheduleQuery,
-    HarvestTimingQuery
+    AgentTask,
+    AgentTaskRequest,
+    BatchAgentRequest,
+    TASK_REQUEST_MODELS
 )
 
 router = APIRouter(prefix="/agent", tags=["agent"])
-agent_interface = MCPAgentInterface()
+
+_TASK_BODY_PARSERS = {
+    task: json_body(model) for task, model in TASK_REQUEST_MODELS.items()
+}
+
+
+async def _task_body(task: AgentTask, request: Request) -> AgentTaskRequest:
+    """Validate the body against the schema selected by the task path segment."""
+    return await _TASK_BODY_PARSERS[task](request)
+
+
+def _task_body_doc() -> Dict[str, Any]:
+    """Document the task body: a context plus one of the task query schemas."""
+    doc = body_doc(AgentTaskRequest[AgentQuery])
+    schema = doc["requestBody"]["content"]["application/json"]["schema"]
+    query = schema["properties"]["query"]
+    query["oneOf"] = query.pop("anyOf")
+    return doc
+
 
 @router.post("/initialize", response_model=AgentResponse)
-async def initialize_agent_context(context: AgentContext):
+async def initialize_agent_context(
+    context: AgentContext,
+    agent_interface: MCPAgentInterface = Depends(get_agent_interface)
+):
     """Initialize the agent context with location and task information."""
     return await agent_interface.initialize_context(context)
 
-@router.post("/crop-management", response_model=AgentResponse)
-async def process_crop_management(
-    query: CropManagementQuery,
-    context: AgentContext
-):
-    """Process crop management decisions through the AI agent."""
-    return await agent_interface.process_crop_management(query, context)
-
-@router.post("/soil-analysis", response_model=AgentResponse)
-async def process_soil_analysis(
-    query: SoilAnalysisQuery,
-    context: AgentContext
+@router.post("/batch", response_model=List[AgentResponse])
+async def process_agent_batch(
+    request: BatchAgentRequest,
+    agent_interface: MCPAgentInterface = Depends(get_agent_interface)
 ):
-    """Process soil analysis data through the AI agent."""
-    return await agent_interface.process_soil_analysis(query, context)
+    """
+    Process several agent tasks in one call against a shared context.
 
-@router.post("/pest-control", response_model=AgentResponse)
-async def process_pest_control(
-    query: PestControlQuery,
-    context: AgentContext
-):
-    """Process pest control situations through the AI agent."""
-    return await agent_interface.process_pest_control(query, context)
+    Responses are returned in the same order as the submitted items.
+    """
+    return await asyncio.gather(*(
+        agent_interface.dispatch(item.query, request.context)
+        for item in request.items
+    ))
 
-@router.post("/irrigation-schedule", response_model=AgentResponse)
-async def process_irrigation_schedule(
-    query: IrrigationScheduleQuery,
-    context: AgentContext
+@router.post("/{task}", response_model=AgentResponse, openapi_extra=_task_body_doc())
+async def process_agent_task(
+    task: AgentTask,
+    body: AgentTaskRequest = Depends(_task_body),
+    agent_interface: MCPAgentInterface = Depends(get_agent_interface)
 ):
-    """Process irrigation scheduling through the AI agent."""
-    return await agent_interface.process_irrigation_schedule(query, context)
+    """
+    Process an agent task (crop management, soil analysis, pest control,
+    irrigation scheduling or harvest timing) through the AI agent.
 
-@router.post("/harvest-timing", response_model=AgentResponse)
-async def process_harvest_timing(
-    query: HarvestTimingQuery,
-    context: AgentContext
-):
-    """Process harvest timing decisions through the AI agent."""
-    return await agent_interface.process_harvest_timing(query, context)
+    The task path segment selects the query schema the body is validated
+    against, so one route serves every task.
+    """
+    return await agent_interface.dispatch(body.query, body.context)
 
 @router.get("/recommendations", response_model=List[str])
-async def get_recommendations(context: AgentContext):
+async def get_recommendations(
+    context: AgentContext,
+    agent_interface: MCPAgentInterface = Depends(get_agent_interface)
+):
     """Get AI agent recommendations based on current context."""
     return await agent_interface.get_agent_recommendations(context)
@@ -1,12 +1,18 @@
 from fastapi import APIRouter, Depends, HTTPException
 from typing import List, Dict, Any
 from datetime import datetime
+import time
 
+from app.api.cache import cached
+from app.api.dependencies import (
+    LocationParam, get_crop_service, get_weather_service
+)
 from app.core.models.crop import CropType, GrowthStage, CropInfo
 from app.core.models.location import GeoLocation
 from app.core.services import CropManagementService, WeatherService
-from app.core.services.crop_service import get_crop_service
-from app.core.services.weather_service import get_weather_service
+from app.config import get_settings
+
+settings = get_settings()
 
 router = APIRouter(
     prefix="/crops",
@@ -15,47 +21,49 @@ router = APIRouter(
 )
 
 
-@router.get("/schedule/{crop_type}/{location_id}")
+@router.get("/schedule/{crop_type}/{location_id}", response_model=Dict[str, Any])
+@cached(
+    expire=settings.WEATHER_CACHE_TTL,
+    key_builder=lambda kw: (
+        "crops:schedule", kw["crop_type"], kw["loc"].location_id,
+        kw["target_harvest_date"])
+)
 async def get_planting_schedule(
     crop_type: CropType,
-    location_id: str,
+    loc: LocationParam = Depends(),
     target_harvest_date: datetime | None = None,
-    crop_service: CropManagementService = Depends(get_crop_service),
-    weather_service: WeatherService = Depends(get_weather_service)
+    crop_service: CropManagementService = Depends(get_crop_service)
 ):
     """Get optimal planting schedule for a specific crop and location."""
     try:
-        lat, lon = map(float, location_id.split(','))
-        location = GeoLocation(latitude=lat, longitude=lon)
-        return await crop_service.get_optimal_planting_schedule(
-            crop_type, location, target_harvest_date
+        return crop_service.get_optimal_planting_schedule(
+            crop_type, loc.location, target_harvest_date
         )
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid location format")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/conditions/{crop_type}/{location_id}")
+@router.get("/conditions/{crop_type}/{location_id}", response_model=Dict[str, Any])
+@cached(
+    expire=settings.WEATHER_CACHE_TTL,
+    key_builder=lambda kw: (
+        "crops:conditions", kw["crop_type"], kw["loc"].location_id,
+        int(time.time()) // settings.WEATHER_CACHE_TTL)
+)
 async def analyze_conditions(
     crop_type: CropType,
-    location_id: str,
+    loc: LocationParam = Depends(),
     crop_service: CropManagementService = Depends(get_crop_service),
     weather_service: WeatherService = Depends(get_weather_service)
 ):
     """Analyze growing conditions for a specific crop and location."""
     try:
-        lat, lon = map(float, location_id.split(','))
-        location = GeoLocation(latitude=lat, longitude=lon)
-
         # Get current weather conditions first
-        current_weather = await weather_service.get_current_weather(location)
+        current_weather = await weather_service.get_current_weather(loc.location)
 
         # Analyze conditions based on current weather
         return await crop_service.analyze_growing_conditions(
-            crop_type, location, current_weather
+            crop_type, loc.location, current_weather
         )
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid location format")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
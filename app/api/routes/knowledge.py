@@ -2,10 +2,17 @@ from fastapi import APIRouter, Depends, HTTPException
 from typing import List, Dict, Any
 from datetime import datetime
 
+from app.api.cache import cached
 from app.core.models.crop import CropType, GrowthStage
 from app.core.models.location import GeoLocation
-from app.core.services import KnowledgeBaseService
-from app.core.services.knowledge_service import get_knowledge_service
+from app.core.schemas.advanced_validation import ClimateZone
+from app.core.services import KnowledgeBaseService, WeatherService
+from app.api.dependencies import (
+    LocationParam, get_knowledge_service, get_weather_service
+)
+from app.config import get_settings
+
+settings = get_settings()
 
 router = APIRouter(
     prefix="/knowledge",
@@ -14,10 +21,16 @@ router = APIRouter(
 )
 
 
-@router.get("/farming-techniques/{crop_type}")
+@router.get("/farming-techniques/{crop_type}", response_model=Dict[str, Any])
+@cached(
+    expire=settings.KNOWLEDGE_CACHE_TTL,
+    key_builder=lambda kw: (
+        "knowledge:techniques", kw["crop_type"], kw["climate_zone"],
+        kw["soil_type"])
+)
 async def get_farming_techniques(
     crop_type: CropType,
-    climate_zone: str,
+    climate_zone: ClimateZone,
     soil_type: str,
     knowledge_service: KnowledgeBaseService = Depends(get_knowledge_service)
 ):
@@ -30,7 +43,13 @@ async def get_farming_techniques(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/disease-risks/{crop_type}")
+@router.get("/disease-risks/{crop_type}", response_model=List[Dict[str, Any]])
+@cached(
+    expire=settings.KNOWLEDGE_CACHE_TTL,
+    key_builder=lambda kw: (
+        "knowledge:disease-risks", kw["crop_type"], kw["temperature"],
+        kw["humidity"])
+)
 async def get_disease_risks(
     crop_type: CropType,
     temperature: float,
@@ -46,7 +65,41 @@ async def get_disease_risks(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/protection-measures/{crop_type}")
+@router.get(
+    "/disease-risks/{crop_type}/forecast/{location_id}",
+    response_model=List[Dict[str, Any]]
+)
+@cached(
+    expire=settings.FORECAST_CACHE_TTL,
+    key_builder=lambda kw: (
+        "knowledge:forecast-disease-risks", kw["crop_type"],
+        kw["loc"].location_id, kw["days"])
+)
+async def get_forecast_disease_risks(
+    crop_type: CropType,
+    loc: LocationParam = Depends(),
+    days: int = 7,
+    knowledge_service: KnowledgeBaseService = Depends(get_knowledge_service),
+    weather_service: WeatherService = Depends(get_weather_service)
+):
+    """Get the diseases at risk at any point over a location's weather forecast."""
+    try:
+        forecast = await weather_service.get_weather_forecast(loc.location, days)
+        return knowledge_service.get_forecast_disease_risks(
+            crop_type, forecast.forecast_data
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get(
+    "/protection-measures/{crop_type}", response_model=Dict[str, List[str]]
+)
+@cached(
+    expire=settings.KNOWLEDGE_CACHE_TTL,
+    key_builder=lambda kw: (
+        "knowledge:protection", kw["crop_type"], kw["growth_stage"])
+)
 async def get_protection_measures(
     crop_type: CropType,
     growth_stage: GrowthStage,
@@ -1,12 +1,15 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from typing import Dict, Any, List
 
+from app.api.body import body_doc, json_body
 from app.core.schemas.advanced_validation import (
     CropManagementQuery,
     SoilAnalysisQuery,
     PestControlQuery,
     IrrigationScheduleQuery,
-    HarvestTimingQuery
+    HarvestTimingQuery,
+    CROP_QUERY_BATCH,
+    SOIL_QUERY_BATCH
 )
 
 router = APIRouter(
@@ -16,9 +19,15 @@ router = APIRouter(
                404: {"description": "Not found"}}
 )
 
+# Treatment urgency per infestation level (1-5); index 0 is unused
+_URGENCY = ("low", "low", "low", "medium", "high", "high")
+_URGENCY_NOTES = tuple(f"Treatment urgency: {u.upper()}" for u in _URGENCY)
 
-@router.post("/crop-management")
-async def validate_crop_management(query: CropManagementQuery) -> Dict[str, Any]:
+
+@router.post("/crop-management", openapi_extra=body_doc(CropManagementQuery))
+async def validate_crop_management(
+    query: CropManagementQuery = Depends(json_body(CropManagementQuery))
+) -> Dict[str, Any]:
     """Validate crop management parameters and provide recommendations."""
     return {
         "status": "valid",
@@ -30,8 +39,10 @@ async def validate_crop_management(query: CropManagementQuery) -> Dict[str, Any]
     }
 
 
-@router.post("/soil-analysis")
-async def validate_soil_analysis(query: SoilAnalysisQuery) -> Dict[str, Any]:
+@router.post("/soil-analysis", openapi_extra=body_doc(SoilAnalysisQuery))
+async def validate_soil_analysis(
+    query: SoilAnalysisQuery = Depends(json_body(SoilAnalysisQuery))
+) -> Dict[str, Any]:
     """Validate soil analysis results and provide recommendations."""
     recommendations = []
 
@@ -50,28 +61,46 @@ async def validate_soil_analysis(query: SoilAnalysisQuery) -> Dict[str, Any]:
     }
 
 
-@router.post("/pest-control")
-async def validate_pest_control(query: PestControlQuery) -> Dict[str, Any]:
-    """Validate pest control parameters and provide recommendations."""
-    level_info = query.infestation_level
+@router.post("/crop-management/batch", openapi_extra=body_doc(CROP_QUERY_BATCH))
+async def validate_crop_management_batch(
+    queries: List[CropManagementQuery] = Depends(json_body(CROP_QUERY_BATCH))
+) -> List[Dict[str, Any]]:
+    """Validate a list of crop management queries; results keep the input order."""
+    return [await validate_crop_management(query) for query in queries]
+
 
-    treatment_urgency = "low" if level_info["level"] <= 2 else \
-        "medium" if level_info["level"] == 3 else "high"
+@router.post("/soil-analysis/batch", openapi_extra=body_doc(SOIL_QUERY_BATCH))
+async def validate_soil_analysis_batch(
+    queries: List[SoilAnalysisQuery] = Depends(json_body(SOIL_QUERY_BATCH))
+) -> List[Dict[str, Any]]:
+    """Validate a list of soil analysis queries; results keep the input order."""
+    return [await validate_soil_analysis(query) for query in queries]
+
+
+@router.post("/pest-control", openapi_extra=body_doc(PestControlQuery))
+async def validate_pest_control(
+    query: PestControlQuery = Depends(json_body(PestControlQuery))
+) -> Dict[str, Any]:
+    """Validate pest control parameters and provide recommendations."""
+    level = query.infestation_level
+    description = query.infestation_description
 
     return {
         "status": "valid",
-        "urgency": treatment_urgency,
-        "description": level_info["description"],
+        "urgency": _URGENCY[level],
+        "description": description,
         "recommendations": [
-            f"Current infestation level: {level_info['description']}",
+            f"Current infestation level: {description}",
             "Consider integrated pest management approach",
-            f"Treatment urgency: {treatment_urgency.upper()}"
+            _URGENCY_NOTES[level]
         ]
     }
 
 
-@router.post("/irrigation-schedule")
-async def validate_irrigation_schedule(query: IrrigationScheduleQuery) -> Dict[str, Any]:
+@router.post("/irrigation-schedule", openapi_extra=body_doc(IrrigationScheduleQuery))
+async def validate_irrigation_schedule(
+    query: IrrigationScheduleQuery = Depends(json_body(IrrigationScheduleQuery))
+) -> Dict[str, Any]:
     """Validate irrigation parameters and provide schedule recommendations."""
     return {
         "status": "valid",
@@ -84,8 +113,10 @@ async def validate_irrigation_schedule(query: IrrigationScheduleQuery) -> Dict[s
     }
 
 
-@router.post("/harvest-timing")
-async def validate_harvest_timing(query: HarvestTimingQuery) -> Dict[str, Any]:
+@router.post("/harvest-timing", openapi_extra=body_doc(HarvestTimingQuery))
+async def validate_harvest_timing(
+    query: HarvestTimingQuery = Depends(json_body(HarvestTimingQuery))
+) -> Dict[str, Any]:
     """Validate harvest timing parameters and provide recommendations."""
     try:
         # This will trigger the validation
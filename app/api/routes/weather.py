@@ -1,17 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, Path
-from typing import List, Dict, Any
+from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Dict, Any, Tuple
 from datetime import datetime
-from functools import lru_cache
+import asyncio
 
+from app.api.cache import cached
+from app.api.dependencies import LocationParam, get_weather_service
 from app.core.models.location import GeoLocation
 from app.core.models.weather import WeatherCondition, WeatherForecast
 from app.core.services.weather_service import WeatherService
+from app.config import get_settings
 
-
-@lru_cache()
-def get_weather_service():
-    return WeatherService()
-
+settings = get_settings()
 
 router = APIRouter(
     prefix="/weather",
@@ -49,9 +48,12 @@ router = APIRouter(
         500: {"description": "Internal server error or weather service unavailable"}
     }
 )
+@cached(
+    expire=settings.WEATHER_CACHE_TTL,
+    key_builder=lambda kw: f"weather:current:{kw['loc'].location_id}"
+)
 async def get_current_weather(
-    location_id: str = Path(...,
-                            description="Location ID in format 'latitude,longitude'"),
+    loc: LocationParam = Depends(),
     weather_service: WeatherService = Depends(get_weather_service)
 ):
     """
@@ -69,44 +71,70 @@ async def get_current_weather(
     - HTTPException(500): If weather service is unavailable
     """
     try:
-        # Parse location_id into lat/lon
-        lat, lon = map(float, location_id.split(','))
-        location = GeoLocation(latitude=lat, longitude=lon)
-        return await weather_service.get_current_weather(location)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid location format")
+        return await weather_service.get_current_weather(loc.location)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/current/batch", response_model=List[WeatherCondition])
+async def get_current_weather_batch(
+    locations: List[GeoLocation],
+    weather_service: WeatherService = Depends(get_weather_service)
+):
+    """
+    Get current weather conditions for many locations in one call.
+
+    Locations within ~1 km of each other (same coordinates rounded to two
+    decimals) share a single upstream request. Results are returned in the
+    same order as the submitted locations.
+    """
+    try:
+        groups: Dict[Tuple[float, float], int] = {}
+        unique: List[GeoLocation] = []
+        slots: List[int] = []
+        for location in locations:
+            key = (round(location.latitude, 2), round(location.longitude, 2))
+            if key not in groups:
+                groups[key] = len(unique)
+                unique.append(location)
+            slots.append(groups[key])
+
+        results = await asyncio.gather(
+            *(weather_service.get_current_weather(loc) for loc in unique))
+        return [results[slot] for slot in slots]
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/forecast/{location_id}", response_model=WeatherForecast)
+@cached(
+    expire=settings.FORECAST_CACHE_TTL,
+    key_builder=lambda kw: f"weather:forecast:{kw['loc'].location_id}:{kw['days']}"
+)
 async def get_weather_forecast(
-    location_id: str,
+    loc: LocationParam = Depends(),
     days: int = 7,
     weather_service: WeatherService = Depends(get_weather_service)
 ):
     """Get weather forecast for a specific location."""
     try:
-        lat, lon = map(float, location_id.split(','))
-        location = GeoLocation(latitude=lat, longitude=lon)
-        return await weather_service.get_weather_forecast(location, days)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid location format")
+        return await weather_service.get_weather_forecast(loc.location, days)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/soil/{location_id}")
+@router.get("/soil/{location_id}", response_model=Dict[str, Any])
+@cached(
+    expire=settings.WEATHER_CACHE_TTL,
+    key_builder=lambda kw: f"weather:soil:{kw['loc'].location_id}"
+)
 async def get_soil_data(
-    location_id: str,
+    loc: LocationParam = Depends(),
     weather_service: WeatherService = Depends(get_weather_service)
 ):
     """Get soil data for a specific location."""
     try:
-        lat, lon = map(float, location_id.split(','))
-        location = GeoLocation(latitude=lat, longitude=lon)
-        return await weather_service.get_soil_data(location)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid location format")
+        return await weather_service.get_soil_data(loc.location)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
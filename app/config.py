@@ -1,7 +1,13 @@
-from pydantic_settings import BaseSettings
+import json
+import os
+from dataclasses import dataclass, fields
 from functools import lru_cache
 
-class Settings(BaseSettings):
+from dotenv import load_dotenv
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
     # API Keys
     AGROMONITORING_API_KEY: str = ""
     WEATHER_COMPANY_API_KEY: str = ""
@@ -15,18 +21,50 @@ class Settings(BaseSettings):
     ENVIRONMENT: str = "development"
     LOG_LEVEL: str = "INFO"
 
+    # Server Settings ("auto" picks uvloop/httptools when they are installed)
+    WORKERS: int = os.cpu_count() or 1
+    LOOP: str = "auto"
+    HTTP: str = "auto"
+    LIMIT_CONCURRENCY: int = 1000  # Keep in step with the httpx pool size
+
     # CORS Settings
-    ALLOWED_ORIGINS: list[str] = ["*"]
-    ALLOWED_METHODS: list[str] = ["*"]
-    ALLOWED_HEADERS: list[str] = ["*"]
+    ALLOWED_ORIGINS: tuple[str, ...] = ("*",)
+    ALLOWED_METHODS: tuple[str, ...] = ("*",)
+    ALLOWED_HEADERS: tuple[str, ...] = ("*",)
+    CORS_MAX_AGE: int = 86400  # Seconds browsers may cache preflight results
 
     # Cache Settings
     CACHE_TTL: int = 3600
+    WEATHER_CACHE_TTL: int = 600
+    FORECAST_CACHE_TTL: int = 1800
+    SOIL_CACHE_TTL: int = 86400
+    KNOWLEDGE_CACHE_TTL: int = 86400
+    ERROR_CACHE_TTL: int = 30
+    RESPONSE_CACHE_SIZE: int = 4096
+
+
+def _parse(value: str, default):
+    """Coerce a raw environment string to the type of the field's default."""
+    if isinstance(default, bool):
+        return value.lower() in ("1", "true", "yes", "on")
+    if isinstance(default, int):
+        return int(value)
+    if isinstance(default, tuple):
+        return tuple(json.loads(value))
+    return value
+
 
-    class Config:
-        env_file = ".env"
+def load_settings() -> Settings:
+    """Read .env once and build Settings from the process environment."""
+    load_dotenv()
+    overrides = {
+        f.name: _parse(os.environ[f.name], f.default)
+        for f in fields(Settings)
+        if f.name in os.environ
+    }
+    return Settings(**overrides)
 
 
 @lru_cache()
-def get_settings():
-    return Settings()
+def get_settings() -> Settings:
+    return load_settings()
@@ -1,6 +1,7 @@
-from typing import Dict, List, Any, Optional
-from pydantic import BaseModel
+from typing import Annotated, Dict, Generic, List, Any, Literal, Optional, Tuple, Type, TypeVar, Union
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
+from enum import Enum
 from app.core.schemas.advanced_validation import (
     CropManagementQuery,
     SoilAnalysisQuery,
@@ -12,8 +13,72 @@ from app.core.schemas.advanced_validation import (
     IrrigationMethod
 )
 
+# Static response fragments shared by every call
+_INIT_RECS = (
+    "Context initialized successfully",
+    "Ready to process agricultural queries"
+)
+_INIT_NEXT = (
+    "validate_growing_conditions",
+    "check_weather_forecast",
+    "assess_soil_conditions"
+)
+_CROP_RECS_TAIL = ("Monitor weather conditions closely",)
+_CROP_NEXT = (
+    "schedule_irrigation",
+    "plan_fertilization",
+    "set_monitoring_schedule"
+)
+_SOIL_RECS_TAIL = (
+    "Consider organic matter amendments",
+    "Schedule regular soil testing"
+)
+_SOIL_NEXT = (
+    "adjust_soil_ph",
+    "plan_fertilization",
+    "monitor_soil_moisture"
+)
+_PEST_RECS = (
+    "Implement integrated pest management",
+    "Consider biological control methods",
+    "Monitor pest population development"
+)
+_PEST_NEXT = (
+    "schedule_treatment",
+    "monitor_effectiveness",
+    "plan_prevention_measures"
+)
+_IRR_RECS_TAIL = (
+    "Adjust irrigation based on forecast",
+    "Monitor water efficiency"
+)
+_IRR_NEXT = (
+    "implement_irrigation_schedule",
+    "monitor_soil_moisture",
+    "track_water_usage"
+)
+_HARVEST_RECS = (
+    "Monitor grain moisture levels",
+    "Check weather forecast for harvest window",
+    "Prepare harvesting equipment"
+)
+_HARVEST_NEXT = (
+    "schedule_harvest",
+    "arrange_storage",
+    "monitor_conditions"
+)
+_AGENT_RECS = (
+    "Optimize planting schedule based on weather forecast",
+    "Implement precision irrigation based on soil moisture",
+    "Monitor crop health indicators",
+    "Plan preventive pest control measures",
+    "Schedule regular soil testing"
+)
+
 class AgentContext(BaseModel):
     """Context information for AI agent interactions."""
+    model_config = ConfigDict(frozen=True)
+
     timestamp: datetime
     location: Dict[str, float]  # latitude, longitude
     current_task: Optional[str] = None
@@ -22,6 +87,8 @@ class AgentContext(BaseModel):
 
 class AgentAction(BaseModel):
     """Represents an action that an AI agent can take."""
+    model_config = ConfigDict(frozen=True)
+
     action_type: str
     parameters: Dict[str, Any]
     confidence: float
@@ -35,26 +102,127 @@ class AgentResponse(BaseModel):
     next_actions: List[str]
     context_updates: Optional[Dict[str, Any]] = None
 
+class AgentTask(str, Enum):
+    """Agent tasks routed through the single /agent/{task} endpoint."""
+    CROP_MANAGEMENT = "crop-management"
+    SOIL_ANALYSIS = "soil-analysis"
+    PEST_CONTROL = "pest-control"
+    IRRIGATION_SCHEDULE = "irrigation-schedule"
+    HARVEST_TIMING = "harvest-timing"
+
+
+AgentQuery = Union[
+    CropManagementQuery,
+    SoilAnalysisQuery,
+    PestControlQuery,
+    IrrigationScheduleQuery,
+    HarvestTimingQuery
+]
+
+TASK_QUERY_MODELS: Dict[AgentTask, Type[BaseModel]] = {
+    AgentTask.CROP_MANAGEMENT: CropManagementQuery,
+    AgentTask.SOIL_ANALYSIS: SoilAnalysisQuery,
+    AgentTask.PEST_CONTROL: PestControlQuery,
+    AgentTask.IRRIGATION_SCHEDULE: IrrigationScheduleQuery,
+    AgentTask.HARVEST_TIMING: HarvestTimingQuery,
+}
+
+
+QueryT = TypeVar("QueryT")
+
+
+class AgentTaskRequest(BaseModel, Generic[QueryT]):
+    """Body of a single /agent/{task} request."""
+    query: QueryT
+    context: AgentContext
+
+
+# Body schema per task, each validated straight from JSON in one pass
+TASK_REQUEST_MODELS: Dict[AgentTask, Type[AgentTaskRequest]] = {
+    task: AgentTaskRequest[model] for task, model in TASK_QUERY_MODELS.items()
+}
+
+
+class CropManagementItem(BaseModel):
+    """Batched crop management task."""
+    task: Literal[AgentTask.CROP_MANAGEMENT]
+    query: CropManagementQuery
+
+
+class SoilAnalysisItem(BaseModel):
+    """Batched soil analysis task."""
+    task: Literal[AgentTask.SOIL_ANALYSIS]
+    query: SoilAnalysisQuery
+
+
+class PestControlItem(BaseModel):
+    """Batched pest control task."""
+    task: Literal[AgentTask.PEST_CONTROL]
+    query: PestControlQuery
+
+
+class IrrigationScheduleItem(BaseModel):
+    """Batched irrigation schedule task."""
+    task: Literal[AgentTask.IRRIGATION_SCHEDULE]
+    query: IrrigationScheduleQuery
+
+
+class HarvestTimingItem(BaseModel):
+    """Batched harvest timing task."""
+    task: Literal[AgentTask.HARVEST_TIMING]
+    query: HarvestTimingQuery
+
+
+# A single task within a batched agent request; task selects the query schema
+AgentBatchItem = Annotated[
+    Union[
+        CropManagementItem,
+        SoilAnalysisItem,
+        PestControlItem,
+        IrrigationScheduleItem,
+        HarvestTimingItem
+    ],
+    Field(discriminator="task")
+]
+
+
+class BatchAgentRequest(BaseModel):
+    """Several agent tasks evaluated against one shared context."""
+    items: List[AgentBatchItem]
+    context: AgentContext
+
+
 class MCPAgentInterface:
-    """Interface for AI agents to interact with the Agriculture MCP."""
+    """
+    Interface for AI agents to interact with the Agriculture MCP.
+
+    The interface holds no per-request state; callers pass the context
+    explicitly, so one instance can be shared by all requests.
+    """
 
     def __init__(self):
-        self.current_context: Optional[AgentContext] = None
+        self._handlers = {
+            CropManagementQuery: self.process_crop_management,
+            SoilAnalysisQuery: self.process_soil_analysis,
+            PestControlQuery: self.process_pest_control,
+            IrrigationScheduleQuery: self.process_irrigation_schedule,
+            HarvestTimingQuery: self.process_harvest_timing,
+        }
+
+    async def dispatch(
+        self,
+        query: AgentQuery,
+        context: Optional[AgentContext] = None
+    ) -> AgentResponse:
+        """Route a validated query to its task handler."""
+        return await self._handlers[type(query)](query, context)
 
     async def initialize_context(self, context: AgentContext) -> AgentResponse:
-        """Initialize or update the agent's context."""
-        self.current_context = context
+        """Acknowledge the agent's context."""
         return AgentResponse(
             success=True,
-            recommendations=[
-                "Context initialized successfully",
-                "Ready to process agricultural queries"
-            ],
-            next_actions=[
-                "validate_growing_conditions",
-                "check_weather_forecast",
-                "assess_soil_conditions"
-            ]
+            recommendations=_INIT_RECS,
+            next_actions=_INIT_NEXT
         )
 
     async def process_crop_management(
@@ -63,12 +231,9 @@ class MCPAgentInterface:
         context: Optional[AgentContext] = None
     ) -> AgentResponse:
         """Process crop management decisions."""
-        if context:
-            self.current_context = context
-
         action = AgentAction(
             action_type="crop_management",
-            parameters=query.dict(),
+            parameters=query.model_dump(mode='python'),
             confidence=0.9,
             reasoning="Based on soil type and climate zone compatibility"
         )
@@ -79,13 +244,9 @@ class MCPAgentInterface:
             recommendations=[
                 f"Proceed with {query.crop_type} planting",
                 f"Optimal soil preparation needed for {query.soil_type}",
-                "Monitor weather conditions closely"
+                *_CROP_RECS_TAIL
             ],
-            next_actions=[
-                "schedule_irrigation",
-                "plan_fertilization",
-                "set_monitoring_schedule"
-            ]
+            next_actions=_CROP_NEXT
         )
 
     async def process_soil_analysis(
@@ -98,20 +259,15 @@ class MCPAgentInterface:
             success=True,
             action_taken=AgentAction(
                 action_type="soil_analysis",
-                parameters=query.dict(),
+                parameters=query.model_dump(mode='python'),
                 confidence=0.85,
                 reasoning="Based on NPK levels and pH analysis"
             ),
             recommendations=[
                 f"pH level at {query.ph_level} requires attention",
-                "Consider organic matter amendments",
-                "Schedule regular soil testing"
+                *_SOIL_RECS_TAIL
             ],
-            next_actions=[
-                "adjust_soil_ph",
-                "plan_fertilization",
-                "monitor_soil_moisture"
-            ]
+            next_actions=_SOIL_NEXT
         )
 
     async def process_pest_control(
@@ -124,20 +280,12 @@ class MCPAgentInterface:
             success=True,
             action_taken=AgentAction(
                 action_type="pest_control",
-                parameters=query.dict(),
+                parameters=query.model_dump(mode='python'),
                 confidence=0.75,
                 reasoning=f"Based on infestation level {query.infestation_level}"
             ),
-            recommendations=[
-                "Implement integrated pest management",
-                "Consider biological control methods",
-                "Monitor pest population development"
-            ],
-            next_actions=[
-                "schedule_treatment",
-                "monitor_effectiveness",
-                "plan_prevention_measures"
-            ]
+            recommendations=_PEST_RECS,
+            next_actions=_PEST_NEXT
         )
 
     async def process_irrigation_schedule(
@@ -150,20 +298,15 @@ class MCPAgentInterface:
             success=True,
             action_taken=AgentAction(
                 action_type="irrigation_schedule",
-                parameters=query.dict(),
+                parameters=query.model_dump(mode='python'),
                 confidence=0.95,
                 reasoning="Based on soil moisture and weather forecast"
             ),
             recommendations=[
                 f"Current soil moisture: {query.soil_moisture}%",
-                "Adjust irrigation based on forecast",
-                "Monitor water efficiency"
+                *_IRR_RECS_TAIL
             ],
-            next_actions=[
-                "implement_irrigation_schedule",
-                "monitor_soil_moisture",
-                "track_water_usage"
-            ]
+            next_actions=_IRR_NEXT
         )
 
     async def process_harvest_timing(
@@ -176,31 +319,17 @@ class MCPAgentInterface:
             success=True,
             action_taken=AgentAction(
                 action_type="harvest_timing",
-                parameters=query.dict(),
+                parameters=query.model_dump(mode='python'),
                 confidence=0.9,
                 reasoning="Based on growing degree days and grain moisture"
             ),
-            recommendations=[
-                "Monitor grain moisture levels",
-                "Check weather forecast for harvest window",
-                "Prepare harvesting equipment"
-            ],
-            next_actions=[
-                "schedule_harvest",
-                "arrange_storage",
-                "monitor_conditions"
-            ]
+            recommendations=_HARVEST_RECS,
+            next_actions=_HARVEST_NEXT
         )
 
     async def get_agent_recommendations(
         self,
         context: AgentContext
-    ) -> List[str]:
+    ) -> Tuple[str, ...]:
         """Get AI agent recommendations based on current context."""
-        return [
-            "Optimize planting schedule based on weather forecast",
-            "Implement precision irrigation based on soil moisture",
-            "Monitor crop health indicators",
-            "Plan preventive pest control measures",
-            "Schedule regular soil testing"
-        ]
+        return _AGENT_RECS
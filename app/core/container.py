@@ -0,0 +1,27 @@
+"""Process-wide service container."""
+from dataclasses import dataclass
+from typing import Optional
+
+import httpx
+
+from app.core.services.weather_service import WeatherService
+from app.core.services.crop_service import CropManagementService
+from app.core.services.knowledge_service import KnowledgeBaseService
+
+
+@dataclass(frozen=True)
+class Services:
+    """The service instances shared by every request in a process."""
+    weather: WeatherService
+    crop: CropManagementService
+    knowledge: KnowledgeBaseService
+
+
+def build_services(client: Optional[httpx.AsyncClient] = None) -> Services:
+    """Wire one WeatherService, bound to client, into every service that needs it."""
+    weather = WeatherService(client=client)
+    return Services(
+        weather=weather,
+        crop=CropManagementService(weather),
+        knowledge=KnowledgeBaseService()
+    )
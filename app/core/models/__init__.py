@@ -1,15 +1,18 @@
+from .enums import CaseInsensitiveEnum
 from .location import GeoLocation
 from .weather import WeatherCondition, WeatherForecast
-from .crop import CropType, GrowthStage, CropInfo
+from .crop import CropType, GrowthStage, CropInfo, FloatPair
 from .schedule import FarmingActivity, FarmingSchedule
 
 __all__ = [
+    'CaseInsensitiveEnum',
     'GeoLocation',
     'WeatherCondition',
     'WeatherForecast',
     'CropType',
     'GrowthStage',
     'CropInfo',
+    'FloatPair',
     'FarmingActivity',
     'FarmingSchedule',
 ]
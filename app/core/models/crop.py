@@ -1,17 +1,17 @@
 from datetime import datetime
-from enum import Enum
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from typing import List, NamedTuple, Optional
+from pydantic import BaseModel, ConfigDict, Field
+from .enums import CaseInsensitiveEnum
 
 
-class CropType(str, Enum):
+class CropType(CaseInsensitiveEnum):
     """Supported crop types."""
     CORN = "corn"
     SUNFLOWER = "sunflower"
     WHEAT = "wheat"
 
 
-class GrowthStage(str, Enum):
+class GrowthStage(CaseInsensitiveEnum):
     """Generic growth stages for cereal crops."""
     GERMINATION = "germination"
     EMERGENCE = "emergence"
@@ -23,28 +23,34 @@ class GrowthStage(str, Enum):
     MATURITY = "maturity"
 
 
+class FloatPair(NamedTuple):
+    """Inclusive (min, max) range."""
+    min: float
+    max: float
+
+
+_CROP_INFO_EXAMPLE = {
+    "crop_type": "corn",
+    "growth_stage": "emergence",
+    "planting_date": "2025-04-15T00:00:00Z",
+    "expected_harvest_date": "2025-09-15T00:00:00Z",
+    "optimal_temp_range": [20.0, 30.0],
+    "optimal_soil_moisture": [50.0, 70.0],
+    "optimal_soil_ph": [6.0, 7.0]
+}
+
+
 class CropInfo(BaseModel):
     """Detailed information about a specific crop type."""
+    model_config = ConfigDict(json_schema_extra={"example": _CROP_INFO_EXAMPLE})
+
     crop_type: CropType
     growth_stage: GrowthStage
     planting_date: datetime
     expected_harvest_date: datetime
-    optimal_temp_range: tuple[float, float] = Field(
+    optimal_temp_range: FloatPair = Field(
         ..., description="Optimal temperature range (min, max) in Celsius")
-    optimal_soil_moisture: tuple[float, float] = Field(
+    optimal_soil_moisture: FloatPair = Field(
         ..., description="Optimal soil moisture range (min, max) in percentage")
-    optimal_soil_ph: tuple[float, float] = Field(
+    optimal_soil_ph: FloatPair = Field(
         ..., description="Optimal soil pH range (min, max)")
-
-    class Config:
-        schema_extra = {
-            "example": {
-                "crop_type": "corn",
-                "growth_stage": "emergence",
-                "planting_date": "2025-04-15T00:00:00Z",
-                "expected_harvest_date": "2025-09-15T00:00:00Z",
-                "optimal_temp_range": (20.0, 30.0),
-                "optimal_soil_moisture": (50.0, 70.0),
-                "optimal_soil_ph": (6.0, 7.0)
-            }
-        }
@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class CaseInsensitiveEnum(str, Enum):
+    """String enum that also accepts case and whitespace variants of its values."""
+
+    @classmethod
+    def _missing_(cls, value):
+        if isinstance(value, str):
+            return cls._value2member_map_.get(value.strip().lower())
+        return None
@@ -1,8 +1,37 @@
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import Any, Callable, Dict, List, Optional
+from pydantic import (
+    BaseModel, ConfigDict, Field, TypeAdapter, computed_field, field_validator,
+    model_validator
+)
 from enum import Enum
 
+from app.core.models.enums import CaseInsensitiveEnum
+from app.core.time_cache import now_like
+
+_ONE_YEAR = timedelta(days=365)
+
+# Queries are immutable request DTOs; unknown fields are rejected
+_QUERY_CONFIG = ConfigDict(frozen=True, extra='forbid',
+                           revalidate_instances='never')
+
+# Infestation descriptions indexed by level (1-5); index 0 is unused
+_INFESTATION_DESC = (
+    None,
+    "Minor presence - Monitoring required",
+    "Light infestation - Consider treatment",
+    "Moderate infestation - Treatment recommended",
+    "Severe infestation - Immediate treatment required",
+    "Critical infestation - Emergency measures needed",
+)
+
+# Irrigation urgency indexed by dry + hot (see IrrigationScheduleQuery.urgency)
+_URGENCY = (
+    "Low - Adequate moisture",
+    "Medium - Monitor conditions",
+    "High - Immediate irrigation needed",
+)
+
 
 class SoilType(str, Enum):
     """Soil type classifications."""
@@ -15,7 +44,7 @@ class SoilType(str, Enum):
     SILTY_CLAY = "silty_clay"
 
 
-class ClimateZone(str, Enum):
+class ClimateZone(CaseInsensitiveEnum):
     """Köppen climate classifications relevant for agriculture."""
     MEDITERRANEAN = "mediterranean"
     CONTINENTAL = "continental"
@@ -37,6 +66,8 @@ class IrrigationMethod(str, Enum):
 
 class CropManagementQuery(BaseModel):
     """Base model for crop management queries."""
+    model_config = _QUERY_CONFIG
+
     crop_type: str
     planting_date: datetime
     field_size: float = Field(..., gt=0, description="Field size in hectares")
@@ -49,59 +80,71 @@ class CropManagementQuery(BaseModel):
     @field_validator('planting_date')
     @classmethod
     def validate_planting_date(cls, v):
-        if v < datetime.now() - timedelta(days=365):
+        # Match the input's awareness so offset-aware dates compare cleanly
+        now = now_like(v)
+        if v < now - _ONE_YEAR:
             raise ValueError(
                 "Planting date cannot be more than a year in the past")
-        if v > datetime.now() + timedelta(days=365):
+        if v > now + _ONE_YEAR:
             raise ValueError(
                 "Planting date cannot be more than a year in the future")
         return v
 
     @model_validator(mode='after')
     def validate_crop_requirements(self) -> 'CropManagementQuery':
-        crop_type = self.crop_type
-        soil_type = self.soil_type
-        climate_zone = self.climate_zone
-
-        if crop_type == 'wheat':
-            if soil_type in [SoilType.SANDY, SoilType.SILTY_CLAY]:
-                raise ValueError("Wheat prefers loamy or clay loam soils")
-            if climate_zone == ClimateZone.TROPICAL:
-                raise ValueError("Wheat is not suitable for tropical climates")
-
-        elif crop_type == 'corn':
-            if climate_zone in [ClimateZone.SUBARCTIC, ClimateZone.MEDITERRANEAN]:
-                raise ValueError("Corn requires longer growing seasons")
-            if not getattr(self, 'irrigation_method', None) and getattr(self, 'expected_rainfall', 0) < 500:
-                raise ValueError(
-                    "Corn requires either irrigation or sufficient rainfall")
-
+        check = _CROP_VALIDATORS.get(self.crop_type)
+        if check is not None:
+            check(self)
         return self
 
 
+# Crop-specific requirement checks, looked up by crop_type
+_WHEAT_BAD_SOILS = frozenset({SoilType.SANDY, SoilType.SILTY_CLAY})
+_CORN_BAD_CLIMATES = frozenset({ClimateZone.SUBARCTIC, ClimateZone.MEDITERRANEAN})
+_CROP_VALIDATORS: Dict[str, Callable[[CropManagementQuery], None]] = {}
+
+
+def _register(crop_type: str):
+    def decorator(fn):
+        _CROP_VALIDATORS[crop_type] = fn
+        return fn
+    return decorator
+
+
+@_register('wheat')
+def _validate_wheat(query: CropManagementQuery) -> None:
+    if query.soil_type in _WHEAT_BAD_SOILS:
+        raise ValueError("Wheat prefers loamy or clay loam soils")
+    if query.climate_zone is ClimateZone.TROPICAL:
+        raise ValueError("Wheat is not suitable for tropical climates")
+
+
+@_register('corn')
+def _validate_corn(query: CropManagementQuery) -> None:
+    if query.climate_zone in _CORN_BAD_CLIMATES:
+        raise ValueError("Corn requires longer growing seasons")
+    if not query.irrigation_method and (query.expected_rainfall or 0) < 500:
+        raise ValueError(
+            "Corn requires either irrigation or sufficient rainfall")
+
+
 class SoilAnalysisQuery(BaseModel):
     """Model for soil analysis queries."""
+    model_config = _QUERY_CONFIG
+
     ph_level: float = Field(..., ge=0, le=14)
     organic_matter: float = Field(..., ge=0, le=100)
-    nitrogen: float = Field(..., ge=0)
-    phosphorus: float = Field(..., ge=0)
-    potassium: float = Field(..., ge=0)
+    # Upper bounds reject unreasonably high NPK readings
+    nitrogen: float = Field(..., ge=0, le=500)
+    phosphorus: float = Field(..., ge=0, le=300)
+    potassium: float = Field(..., ge=0, le=800)
     soil_moisture: float = Field(..., ge=0, le=100)
 
-    @model_validator(mode='after')
-    def check_npk_levels(self) -> 'SoilAnalysisQuery':
-        """Validate NPK levels are within reasonable ranges."""
-        if self.nitrogen > 500:  # Example threshold
-            raise ValueError("Nitrogen level seems unreasonably high")
-        if self.phosphorus > 300:
-            raise ValueError("Phosphorus level seems unreasonably high")
-        if self.potassium > 800:
-            raise ValueError("Potassium level seems unreasonably high")
-        return self
-
 
 class PestControlQuery(BaseModel):
     """Model for pest control queries."""
+    model_config = _QUERY_CONFIG
+
     pest_type: str
     infestation_level: int = Field(..., ge=1, le=5)
     crop_stage: str
@@ -109,22 +152,17 @@ class PestControlQuery(BaseModel):
     humidity: float
     previous_treatments: List[str] = []
 
-    @field_validator('infestation_level')
-    @classmethod
-    def validate_infestation(cls, v: int) -> Dict[str, Any]:
-        """Validate infestation level description."""
-        descriptions = {
-            1: "Minor presence - Monitoring required",
-            2: "Light infestation - Consider treatment",
-            3: "Moderate infestation - Treatment recommended",
-            4: "Severe infestation - Immediate treatment required",
-            5: "Critical infestation - Emergency measures needed"
-        }
-        return {"level": v, "description": descriptions[v]}
+    @computed_field
+    @property
+    def infestation_description(self) -> str:
+        """Human-readable description of the infestation level."""
+        return _INFESTATION_DESC[self.infestation_level]
 
 
 class IrrigationScheduleQuery(BaseModel):
     """Model for irrigation scheduling queries."""
+    model_config = _QUERY_CONFIG
+
     crop_type: str
     growth_stage: str
     soil_moisture: float = Field(..., ge=0, le=100)
@@ -132,24 +170,25 @@ class IrrigationScheduleQuery(BaseModel):
     temperature: float
     humidity: float
     wind_speed: float = Field(..., ge=0)
-    urgency: str = ""  # Field to store irrigation urgency
 
-    @model_validator(mode='after')
-    def check_irrigation_needs(self) -> 'IrrigationScheduleQuery':
-        """Validate irrigation parameters and provide recommendations."""
-        self.urgency: str = ""  # Add urgency field
-        if self.soil_moisture < 30 and self.expected_rainfall < 10:
-            if self.temperature > 30 and self.humidity < 50:
-                self.urgency = "High - Immediate irrigation needed"
-            else:
-                self.urgency = "Medium - Monitor conditions"
-        else:
-            self.urgency = "Low - Adequate moisture"
-        return self
+    @computed_field
+    @property
+    def urgency(self) -> str:
+        """Irrigation urgency derived from moisture, rainfall and heat stress."""
+        dry = self.soil_moisture < 30 and self.expected_rainfall < 10
+        hot = dry and self.temperature > 30 and self.humidity < 50
+        return _URGENCY[dry + hot]
+
+
+# Per-crop harvest readiness thresholds; crops without an entry are unchecked
+_MIN_HARVEST_GDD: Dict[str, float] = {'corn': 2700.0}
+_MAX_GRAIN_MOISTURE: Dict[str, float] = {'wheat': 18.0}
 
 
 class HarvestTimingQuery(BaseModel):
     """Model for harvest timing queries."""
+    model_config = _QUERY_CONFIG
+
     crop_type: str
     planting_date: datetime
     growing_degree_days: float = Field(..., ge=0)
@@ -159,9 +198,28 @@ class HarvestTimingQuery(BaseModel):
     @model_validator(mode='after')
     def validate_harvest_timing(self) -> 'HarvestTimingQuery':
         """Validate harvest timing parameters."""
-        if self.crop_type == 'corn' and self.growing_degree_days < 2700:
+        min_gdd = _MIN_HARVEST_GDD.get(self.crop_type)
+        if min_gdd is not None and self.growing_degree_days < min_gdd:
+            raise ValueError(
+                f"Insufficient growing degree days for {self.crop_type} harvest")
+        max_moisture = _MAX_GRAIN_MOISTURE.get(self.crop_type)
+        if self.grain_moisture and max_moisture is not None \
+                and self.grain_moisture > max_moisture:
             raise ValueError(
-                "Insufficient growing degree days for corn harvest")
-        if self.grain_moisture and self.crop_type == 'wheat' and self.grain_moisture > 18:
-            raise ValueError("Grain moisture too high for wheat harvest")
+                f"Grain moisture too high for {self.crop_type} harvest")
         return self
+
+
+# Whole-list validators, built once so batches validate in a single core call
+CROP_QUERY_BATCH = TypeAdapter(List[CropManagementQuery])
+SOIL_QUERY_BATCH = TypeAdapter(List[SoilAnalysisQuery])
+
+
+def validate_crop_batch(rows: List[Dict[str, Any]]) -> List[CropManagementQuery]:
+    """Validate a list of crop management rows in one pass."""
+    return CROP_QUERY_BATCH.validate_python(rows)
+
+
+def validate_soil_batch(rows: List[Dict[str, Any]]) -> List[SoilAnalysisQuery]:
+    """Validate a list of soil analysis rows in one pass."""
+    return SOIL_QUERY_BATCH.validate_python(rows)
@@ -1,7 +1,9 @@
 from datetime import datetime
-from typing import List, Optional
-from pydantic import BaseModel, Field, validator
+from typing import List, Literal, Optional
+from pydantic import BaseModel, Field, field_validator, model_validator
 from app.core.models.crop import CropType, GrowthStage
+from app.core.schemas.advanced_validation import SoilType
+from app.core.time_cache import now_like
 
 
 class LocationQuery(BaseModel):
@@ -11,18 +13,6 @@ class LocationQuery(BaseModel):
     longitude: float = Field(..., ge=-180, le=180,
                              description="Longitude in decimal degrees")
 
-    @validator('latitude')
-    def validate_latitude(cls, v):
-        if not isinstance(v, (int, float)):
-            raise ValueError('Latitude must be a number')
-        return v
-
-    @validator('longitude')
-    def validate_longitude(cls, v):
-        if not isinstance(v, (int, float)):
-            raise ValueError('Longitude must be a number')
-        return v
-
 
 class WeatherQuery(LocationQuery):
     """Validation model for weather-related queries."""
@@ -31,12 +21,11 @@ class WeatherQuery(LocationQuery):
     end_date: Optional[datetime] = Field(
         None, description="End date for historical data")
 
-    @validator('end_date')
-    def validate_dates(cls, v, values):
-        if 'start_date' in values and values['start_date'] and v:
-            if v < values['start_date']:
-                raise ValueError('End date must be after start date')
-        return v
+    @model_validator(mode='after')
+    def validate_dates(self) -> 'WeatherQuery':
+        if self.start_date and self.end_date and self.end_date < self.start_date:
+            raise ValueError('End date must be after start date')
+        return self
 
 
 class CropScheduleQuery(LocationQuery):
@@ -45,9 +34,10 @@ class CropScheduleQuery(LocationQuery):
     target_harvest_date: Optional[datetime] = Field(
         None, description="Target harvest date")
 
-    @validator('target_harvest_date')
-    def validate_harvest_date(cls, v):
-        if v and v < datetime.now():
+    @field_validator('target_harvest_date')
+    @classmethod
+    def validate_harvest_date(cls, v: Optional[datetime]) -> Optional[datetime]:
+        if v and v < now_like(v):
             raise ValueError('Target harvest date must be in the future')
         return v
 
@@ -61,8 +51,9 @@ class ProtectionMeasuresQuery(BaseModel):
     humidity: float = Field(..., ge=0, le=100,
                             description="Current relative humidity percentage")
 
-    @validator('temperature')
-    def validate_temperature(cls, v):
+    @field_validator('temperature')
+    @classmethod
+    def validate_temperature(cls, v: float) -> float:
         if v < -50 or v > 60:  # Reasonable range for agriculture
             raise ValueError('Temperature must be between -50°C and 60°C')
         return v
@@ -71,16 +62,14 @@ class ProtectionMeasuresQuery(BaseModel):
 class FarmingTechniquesQuery(BaseModel):
     """Validation model for farming techniques queries."""
     crop_type: CropType
-    climate_zone: str = Field(..., description="Köppen climate classification")
-    soil_type: str = Field(..., description="Primary soil type classification")
-
-    @validator('climate_zone')
-    def validate_climate_zone(cls, v):
-        valid_zones = [
-            'mediterranean', 'continental', 'tropical',
-            'semi_arid', 'humid_subtropical'
-        ]
-        if v.lower() not in valid_zones:
-            raise ValueError(
-                f'Climate zone must be one of: {", ".join(valid_zones)}')
-        return v.lower()
+    climate_zone: Literal[
+        'mediterranean', 'continental', 'tropical',
+        'semi_arid', 'humid_subtropical'
+    ] = Field(..., description="Köppen climate classification")
+    soil_type: SoilType = Field(...,
+                                description="Primary soil type classification")
+
+    @field_validator('climate_zone', 'soil_type', mode='before')
+    @classmethod
+    def normalize_case(cls, v):
+        return v.lower() if isinstance(v, str) else v
@@ -3,47 +3,86 @@ from typing import List, Optional, Dict, Any
 from app.core.models.crop import CropType, GrowthStage, CropInfo
 from app.core.models.location import GeoLocation
 from app.core.models.weather import WeatherCondition
+from app.core.time_cache import now_utc
 from .weather_service import WeatherService
 
 
+_CROP_GROWTH_PERIODS = {
+    CropType.CORN: {
+        GrowthStage.GERMINATION: (5, 7),      # 5-7 days
+        GrowthStage.EMERGENCE: (7, 10),       # 7-10 days
+        GrowthStage.TILLERING: (20, 30),      # 20-30 days
+        GrowthStage.STEM_ELONGATION: (15, 20),  # 15-20 days
+        GrowthStage.HEADING: (15, 20),        # 15-20 days
+        GrowthStage.FLOWERING: (10, 15),      # 10-15 days
+        GrowthStage.GRAIN_FILLING: (35, 45),  # 35-45 days
+        GrowthStage.MATURITY: (20, 25),       # 20-25 days
+    },
+    # Add similar periods for other crop types
+}
+
+_OPTIMAL_CONDITIONS = {
+    CropType.CORN: {
+        "temperature": (20.0, 30.0),
+        "soil_moisture": (50.0, 70.0),
+        "soil_ph": (6.0, 7.0)
+    },
+    CropType.WHEAT: {
+        "temperature": (15.0, 25.0),
+        "soil_moisture": (40.0, 60.0),
+        "soil_ph": (6.0, 7.0)
+    },
+    CropType.SUNFLOWER: {
+        "temperature": (18.0, 28.0),
+        "soil_moisture": (45.0, 65.0),
+        "soil_ph": (6.0, 7.5)
+    }
+}
+
+# Flattened (temp_min, temp_max, moisture_min, moisture_max) per crop
+_CONDITION_BOUNDS = {
+    crop: (*optimal["temperature"], *optimal["soil_moisture"])
+    for crop, optimal in _OPTIMAL_CONDITIONS.items()
+}
+
+# Indexed by (value < min) - (value > max) + 1
+_STATUS_TEMP = ("too_hot", "optimal", "too_cold")
+_STATUS_MOIST = ("too_wet", "optimal", "too_dry")
+
+
+def _build_stage_offsets(periods):
+    """Lay out (stage, start, end, duration) from average stage lengths.
+
+    start and end are timedeltas from planting, so building a timeline is
+    just two datetime additions per stage.
+    """
+    offsets, day = [], 0
+    for stage, (min_days, max_days) in periods.items():
+        avg_days = (min_days + max_days) // 2
+        offsets.append((stage, timedelta(days=day),
+                        timedelta(days=day + avg_days), avg_days))
+        day += avg_days
+    return tuple(offsets)
+
+
+# Derived once per crop instead of on every schedule request
+_TOTAL_GROWING_DAYS = {
+    crop: sum(max(period) for period in periods.values())
+    for crop, periods in _CROP_GROWTH_PERIODS.items()
+}
+_STAGE_OFFSETS = {
+    crop: _build_stage_offsets(periods)
+    for crop, periods in _CROP_GROWTH_PERIODS.items()
+}
+
+
 class CropManagementService:
     """Service for managing crop-related operations and recommendations."""
 
     def __init__(self, weather_service: WeatherService):
         self.weather_service = weather_service
-        self._crop_growth_periods = {
-            CropType.CORN: {
-                GrowthStage.GERMINATION: (5, 7),      # 5-7 days
-                GrowthStage.EMERGENCE: (7, 10),       # 7-10 days
-                GrowthStage.TILLERING: (20, 30),      # 20-30 days
-                GrowthStage.STEM_ELONGATION: (15, 20),  # 15-20 days
-                GrowthStage.HEADING: (15, 20),        # 15-20 days
-                GrowthStage.FLOWERING: (10, 15),      # 10-15 days
-                GrowthStage.GRAIN_FILLING: (35, 45),  # 35-45 days
-                GrowthStage.MATURITY: (20, 25),       # 20-25 days
-            },
-            # Add similar periods for other crop types
-        }
-
-        self._optimal_conditions = {
-            CropType.CORN: {
-                "temperature": (20.0, 30.0),
-                "soil_moisture": (50.0, 70.0),
-                "soil_ph": (6.0, 7.0)
-            },
-            CropType.WHEAT: {
-                "temperature": (15.0, 25.0),
-                "soil_moisture": (40.0, 60.0),
-                "soil_ph": (6.0, 7.0)
-            },
-            CropType.SUNFLOWER: {
-                "temperature": (18.0, 28.0),
-                "soil_moisture": (45.0, 65.0),
-                "soil_ph": (6.0, 7.5)
-            }
-        }
 
-    async def get_optimal_planting_schedule(
+    def get_optimal_planting_schedule(
         self,
         crop_type: CropType,
         location: GeoLocation,
@@ -52,19 +91,12 @@ class CropManagementService:
         """
         Calculate the optimal planting schedule based on crop type, location, and target harvest date.
         """
-        # Get weather forecast for the next week
-        forecast = await self.weather_service.get_weather_forecast(location)
+        # Total growing period needed (typical growing season length)
+        total_days = _TOTAL_GROWING_DAYS[crop_type]
 
         # If no target harvest date is provided, calculate based on optimal growing season
         if not target_harvest_date:
-            # Default to typical growing season length
-            growing_days = sum(
-                max(period) for period in self._crop_growth_periods[crop_type].values())
-            target_harvest_date = datetime.utcnow() + timedelta(days=growing_days)
-
-        # Calculate total growing period needed
-        total_days = sum(max(period)
-                         for period in self._crop_growth_periods[crop_type].values())
+            target_harvest_date = now_utc() + timedelta(days=total_days)
 
         # Calculate optimal planting date
         optimal_planting_date = target_harvest_date - \
@@ -90,19 +122,18 @@ class CropManagementService:
         """
         Analyze current growing conditions and provide recommendations.
         """
-        optimal = self._optimal_conditions[crop_type]
+        temp_min, temp_max, moisture_min, moisture_max = _CONDITION_BOUNDS[crop_type]
 
         # Check temperature conditions
-        temp_min, temp_max = optimal["temperature"]
-        temp_status = "optimal" if temp_min <= current_weather.temperature <= temp_max else \
-            "too_cold" if current_weather.temperature < temp_min else "too_hot"
+        temp = current_weather.temperature
+        temp_status = _STATUS_TEMP[(temp < temp_min) - (temp > temp_max) + 1]
 
         # Check soil moisture if available
         moisture_status = "unknown"
-        if current_weather.soil_moisture is not None:
-            moisture_min, moisture_max = optimal["soil_moisture"]
-            moisture_status = "optimal" if moisture_min <= current_weather.soil_moisture <= moisture_max else \
-                "too_dry" if current_weather.soil_moisture < moisture_min else "too_wet"
+        moisture = current_weather.soil_moisture
+        if moisture is not None:
+            moisture_status = _STATUS_MOIST[
+                (moisture < moisture_min) - (moisture > moisture_max) + 1]
 
         # Generate recommendations
         recommendations = []
@@ -119,7 +150,7 @@ class CropManagementService:
             "temperature_status": temp_status,
             "moisture_status": moisture_status,
             "recommendations": recommendations,
-            "optimal_conditions": optimal
+            "optimal_conditions": _OPTIMAL_CONDITIONS[crop_type]
         }
 
     def _calculate_growth_timeline(
@@ -130,20 +161,12 @@ class CropManagementService:
         """
         Calculate the expected timeline for each growth stage.
         """
-        timeline = []
-        current_date = start_date
-
-        for stage, (min_days, max_days) in self._crop_growth_periods[crop_type].items():
-            avg_days = (min_days + max_days) // 2
-            stage_end = current_date + timedelta(days=avg_days)
-
-            timeline.append({
+        return [
+            {
                 "stage": stage,
-                "start_date": current_date,
-                "end_date": stage_end,
+                "start_date": start_date + start,
+                "end_date": start_date + end,
                 "duration_days": avg_days
-            })
-
-            current_date = stage_end
-
-        return timeline
+            }
+            for stage, start, end, avg_days in _STAGE_OFFSETS[crop_type]
+        ]
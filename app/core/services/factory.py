@@ -1,26 +1,48 @@
-"""Service factory functions for dependency injection."""
-from functools import lru_cache
-from app.config import get_settings
+"""Service factory functions for callers outside the FastAPI app.
+
+Requests served by the app resolve services from app.state.services; these
+accessors give scripts and other entry points the same wiring, including
+a pooled upstream client that lives for the rest of the process.
+"""
+import threading
+from typing import Optional
+
+from app.core.container import Services, build_services
+from app.http_clients import create_clients
 from app.core.services.weather_service import WeatherService
 from app.core.services.crop_service import CropManagementService
 from app.core.services.knowledge_service import KnowledgeBaseService
 
+# Built on first use; the lock is only taken on the cold path
+_lock = threading.Lock()
+_services: Optional[Services] = None
+
+
+def get_services() -> Services:
+    """Return the process-wide Services container."""
+    global _services
+    if _services is None:
+        with _lock:
+            if _services is None:
+                _services = build_services(create_clients())
+    return _services
+
 
-@lru_cache()
 def get_weather_service() -> WeatherService:
-    """Create and configure a WeatherService instance."""
-    return WeatherService()
+    """Return the shared WeatherService instance."""
+    return get_services().weather
+
+
+def get_crop_service() -> CropManagementService:
+    """Return the shared CropManagementService instance."""
+    return get_services().crop
 
 
-@lru_cache()
-def get_crop_service(
-    weather_service: WeatherService = get_weather_service()
-) -> CropManagementService:
-    """Create and configure a CropManagementService instance."""
+def make_crop_service(weather_service: WeatherService) -> CropManagementService:
+    """Create an uncached CropManagementService bound to weather_service."""
     return CropManagementService(weather_service)
 
 
-@lru_cache()
 def get_knowledge_service() -> KnowledgeBaseService:
-    """Create and configure a KnowledgeBaseService instance."""
-    return KnowledgeBaseService()
+    """Return the shared KnowledgeBaseService instance."""
+    return get_services().knowledge
@@ -0,0 +1,21 @@
+"""Coalesce concurrent identical upstream calls into one in-flight request."""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+_inflight: Dict[str, "asyncio.Future[Any]"] = {}
+
+
+async def do(key: str, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Run coro_factory() once per key; concurrent callers await the same result.
+
+    The shared future is shielded so a cancelled caller does not cancel the
+    fetch for everyone else waiting on it.
+    """
+    fut = _inflight.get(key)
+    if fut is None:
+        fut = asyncio.ensure_future(coro_factory())
+        _inflight[key] = fut
+        fut.add_done_callback(
+            lambda f: _inflight.pop(key, None) if _inflight.get(key) is f else None)
+    return await asyncio.shield(fut)
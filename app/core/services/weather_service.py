@@ -1,85 +1,188 @@
-from datetime import datetime, timedelta
-from typing import List, Optional
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 import httpx
+from pydantic import TypeAdapter
+from pydantic_core import from_json
+from app.core.cache import TTLCache
 from app.core.models.weather import WeatherCondition, WeatherForecast
 from app.core.models.location import GeoLocation
 from app.config import get_settings
+from . import singleflight
 
 settings = get_settings()
 
+_MISS = object()
+
+# How long a payload is kept for conditional revalidation after it expires
+# from the main cache
+_REVALIDATE_TTL = 86400
+
+# Validates a whole forecast's conditions in one call
+_CONDITIONS = TypeAdapter(List[WeatherCondition])
+
+
+def _grid_key(location: GeoLocation) -> str:
+    """Coordinates rounded to ~1 km, so nearby points share upstream results."""
+    return f"{location.latitude:.2f},{location.longitude:.2f}"
+
 
 class WeatherService:
     """Service for retrieving weather data from external APIs."""
 
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         self.agro_api_key = settings.AGROMONITORING_API_KEY
         self.weather_api_key = settings.WEATHER_COMPANY_API_KEY
         self.agro_base_url = settings.AGROMONITORING_BASE_URL
         self.weather_base_url = settings.WEATHER_COMPANY_BASE_URL
+        self.client = client
+        self._cache = TTLCache(maxsize=settings.RESPONSE_CACHE_SIZE)
+        # Request key -> (etag, last_modified, payload) for conditional GETs
+        self._validators = TTLCache(maxsize=settings.RESPONSE_CACHE_SIZE)
+
+    async def _cached(
+        self,
+        key: str,
+        ttl: int,
+        fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the value cached under key, fetching it once on a miss."""
+        hit = self._cache.get(key, _MISS)
+        if hit is not _MISS:
+            return hit
+        value = await singleflight.do(key, fetch)
+        self._cache.set(key, value, ttl)
+        return value
+
+    async def _get_json(self, url: str, params: Dict[str, Any]) -> Any:
+        """
+        Issue a GET request, reusing the shared client when one is set.
+
+        Payloads served with an ETag or Last-Modified header are remembered,
+        and later requests for the same URL revalidate them; a 304 reply
+        returns the remembered payload without transferring or parsing a body.
+        """
+        key = (url, tuple(sorted(params.items())))
+        known = self._validators.get(key)
+        headers = {}
+        if known is not None:
+            etag, last_modified, _ = known
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        if self.client is not None:
+            response = await self.client.get(url, params=params, headers=headers)
+        else:
+            async with httpx.AsyncClient() as client:
+                response = await client.get(url, params=params, headers=headers)
+
+        if response.status_code == 304 and known is not None:
+            self._validators.set(key, known, _REVALIDATE_TTL)
+            return known[2]
+
+        response.raise_for_status()
+        data = from_json(response.content)
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if etag or last_modified:
+            self._validators.set(key, (etag, last_modified, data), _REVALIDATE_TTL)
+        return data
 
     async def get_current_weather(self, location: GeoLocation) -> WeatherCondition:
         """Get current weather conditions for a location."""
-        async with httpx.AsyncClient() as client:
-            params = {
-                "lat": location.latitude,
-                "lon": location.longitude,
-                "appid": self.agro_api_key
-            }
-
-            response = await client.get(f"{self.agro_base_url}/weather", params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            return WeatherCondition(
-                temperature=data["main"]["temp"],
-                humidity=data["main"]["humidity"],
-                precipitation=data["rain"]["1h"] if "rain" in data else 0.0,
-                wind_speed=data["wind"]["speed"],
-                wind_direction=data["wind"]["deg"],
-                timestamp=datetime.utcfromtimestamp(data["dt"])
-            )
+        return await self._cached(
+            f"cw:{_grid_key(location)}",
+            settings.WEATHER_CACHE_TTL,
+            lambda: self._fetch_current_weather(location)
+        )
+
+    async def _fetch_current_weather(self, location: GeoLocation) -> WeatherCondition:
+        params = {
+            "lat": location.latitude,
+            "lon": location.longitude,
+            "appid": self.agro_api_key
+        }
+
+        data = await self._get_json(f"{self.agro_base_url}/weather", params)
+
+        return WeatherCondition(
+            temperature=data["main"]["temp"],
+            humidity=data["main"]["humidity"],
+            precipitation=data["rain"]["1h"] if "rain" in data else 0.0,
+            wind_speed=data["wind"]["speed"],
+            wind_direction=data["wind"]["deg"],
+            timestamp=data["dt"]
+        )
 
     async def get_weather_forecast(self, location: GeoLocation, days: int = 7) -> WeatherForecast:
         """Get weather forecast for a location."""
-        async with httpx.AsyncClient() as client:
-            params = {
-                "lat": location.latitude,
-                "lon": location.longitude,
-                "appid": self.agro_api_key,
-                "cnt": days * 8  # 3-hour forecasts for the number of days
-            }
-
-            response = await client.get(f"{self.agro_base_url}/forecast", params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            forecast_data = []
-            for item in data["list"]:
-                forecast_data.append(
-                    WeatherCondition(
-                        temperature=item["main"]["temp"],
-                        humidity=item["main"]["humidity"],
-                        precipitation=item["rain"]["3h"] if "rain" in item else 0.0,
-                        wind_speed=item["wind"]["speed"],
-                        wind_direction=item["wind"]["deg"],
-                        timestamp=datetime.utcfromtimestamp(item["dt"])
-                    )
-                )
-
-            return WeatherForecast(
-                location_id=f"{location.latitude},{location.longitude}",
-                forecast_data=forecast_data
-            )
+        conditions = await self._get_forecast_conditions(location, days)
+
+        # The conditions were validated when parsed; skip revalidating them
+        return WeatherForecast.model_construct(
+            location_id=f"{location.latitude},{location.longitude}",
+            forecast_data=conditions
+        )
+
+    async def _get_forecast_conditions(
+        self,
+        location: GeoLocation,
+        days: int
+    ) -> List[WeatherCondition]:
+        return await self._cached(
+            f"fc:{_grid_key(location)}:{days}",
+            settings.FORECAST_CACHE_TTL,
+            lambda: self._fetch_forecast_conditions(location, days)
+        )
+
+    async def _fetch_forecast_conditions(
+        self,
+        location: GeoLocation,
+        days: int
+    ) -> List[WeatherCondition]:
+        params = {
+            "lat": location.latitude,
+            "lon": location.longitude,
+            "appid": self.agro_api_key,
+            "cnt": days * 8  # 3-hour forecasts for the number of days
+        }
+        data = await self._get_json(f"{self.agro_base_url}/forecast", params)
+        return _CONDITIONS.validate_python(
+            [self._forecast_fields(item) for item in data["list"]])
+
+    @staticmethod
+    def _forecast_fields(item: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "temperature": item["main"]["temp"],
+            "humidity": item["main"]["humidity"],
+            "precipitation": item["rain"]["3h"] if "rain" in item else 0.0,
+            "wind_speed": item["wind"]["speed"],
+            "wind_direction": item["wind"]["deg"],
+            "timestamp": item["dt"]  # Unix seconds; validated to an aware UTC datetime
+        }
 
     async def get_soil_data(self, location: GeoLocation) -> dict:
         """Get soil data for a location."""
-        async with httpx.AsyncClient() as client:
-            params = {
-                "lat": location.latitude,
-                "lon": location.longitude,
-                "appid": self.agro_api_key
-            }
-
-            response = await client.get(f"{self.agro_base_url}/soil", params=params)
-            response.raise_for_status()
-            return response.json()
+        params = {
+            "lat": location.latitude,
+            "lon": location.longitude,
+            "appid": self.agro_api_key
+        }
+
+        return await self._cached(
+            f"soil:{_grid_key(location)}",
+            settings.SOIL_CACHE_TTL,
+            lambda: self._get_json(f"{self.agro_base_url}/soil", params)
+        )
+
+    async def get_weather_and_soil(
+        self,
+        location: GeoLocation
+    ) -> Tuple[WeatherCondition, dict]:
+        """Get current weather and soil data for a location, fetched concurrently."""
+        weather, soil = await asyncio.gather(
+            self.get_current_weather(location),
+            self.get_soil_data(location)
+        )
+        return weather, soil
@@ -0,0 +1,27 @@
+"""Coarse wall-clock reads shared by validators and services."""
+import time
+from datetime import datetime, timezone
+
+# A batch validated within this window sees a single timestamp
+_RESOLUTION = 0.5
+
+_last_tick = float("-inf")
+_last_now = datetime.min
+
+
+def now_utc() -> datetime:
+    """Return the current naive UTC time, refreshed at most every _RESOLUTION seconds."""
+    global _last_tick, _last_now
+    tick = time.monotonic()
+    if tick - _last_tick > _RESOLUTION:
+        _last_now = datetime.now(timezone.utc).replace(tzinfo=None)
+        _last_tick = tick
+    return _last_now
+
+
+def now_like(value: datetime) -> datetime:
+    """Return now_utc() with the same offset-awareness as value, for comparisons."""
+    now = now_utc()
+    if value.tzinfo is not None:
+        return now.replace(tzinfo=timezone.utc)
+    return now
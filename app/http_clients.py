@@ -0,0 +1,11 @@
+"""Shared outbound HTTP clients for upstream API calls."""
+import httpx
+
+
+def create_clients() -> httpx.AsyncClient:
+    """Create the pooled client used for all upstream weather API calls."""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=100,
+                            max_connections=1000),
+        timeout=httpx.Timeout(10.0),
+    )
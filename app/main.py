@@ -1,24 +1,53 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.api.routes import weather_router, validation_router
+from fastapi.middleware.gzip import GZipMiddleware
+from app.api.routes import (
+    weather_router, crops_router, knowledge_router, validation_router
+)
 from app.api.routes.agent import router as agent_router
 from app.config import get_settings
+from app.core.agent.interface import MCPAgentInterface
+from app.core.container import build_services
+from app.http_clients import create_clients
+
+settings = get_settings()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One pooled client per process, shared by every service that calls upstream
+    app.state.services = build_services(create_clients())
+    app.state.agent_interface = MCPAgentInterface()
+    # Build the OpenAPI schema now rather than on the first /docs hit
+    app.openapi()
+    yield
+    await app.state.services.weather.client.aclose()
+
 
 app = FastAPI(
     title="Agriculture MCP",
     description="Model Context Protocol for Agriculture and Cereal Crop Farming",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
-# Configure CORS
+# Configure CORS. Credentials are only allowed for an explicit origin list:
+# browsers reject them with a wildcard, which would also force the middleware
+# to echo each request's Origin instead of sending a static header.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=list(settings.ALLOWED_ORIGINS),
+    allow_credentials="*" not in settings.ALLOWED_ORIGINS,
+    allow_methods=list(settings.ALLOWED_METHODS),
+    allow_headers=list(settings.ALLOWED_HEADERS),
+    max_age=settings.CORS_MAX_AGE,
 )
 
+# Compress larger JSON payloads such as multi-day forecasts
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
 
 @app.get("/")
 async def root():
@@ -30,6 +59,8 @@ async def root():
 
 # Include routers
 app.include_router(weather_router, prefix="/api")
+app.include_router(crops_router, prefix="/api")
+app.include_router(knowledge_router, prefix="/api")
 app.include_router(validation_router, prefix="/api")
 app.include_router(agent_router, prefix="/api")
 
@@ -39,4 +70,12 @@ app.include_router(agent_router, prefix="/api")
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=5000)
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=5000,
+        workers=settings.WORKERS,
+        loop=settings.LOOP,
+        http=settings.HTTP,
+        limit_concurrency=settings.LIMIT_CONCURRENCY,
+    )
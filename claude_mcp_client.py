@@ -3,29 +3,119 @@ Claude MCP Client for Agriculture API
 This script demonstrates how to interact with the Agriculture MCP through ngrok for Claude integration.
 """
 
-import requests
 import json
-from datetime import datetime
-from typing import Dict, Any, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string with second precision."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
 class AgricultureMCPClient:
     """Client for interacting with the Agriculture MCP API."""
 
-    def __init__(self, mcp_base_url: str):
+    def __init__(self, mcp_base_url: str, api_token: Optional[str] = None):
         """
         Initialize the MCP client.
 
         Args:
             mcp_base_url: Base URL of the MCP server (ngrok URL)
+            api_token: Bearer token, if the tunnel or server requires auth
         """
+        # requests is imported here rather than at module level, so importing
+        # this module stays cheap until a client is created
+        import requests
+
         self.base_url = mcp_base_url.rstrip('/')
-        self.session = requests.Session()
-        # Add headers for ngrok if needed
-        self.session.headers.update({
+        self.request_error = requests.exceptions.RequestException
+        self.api_token = api_token
+        # requests does not guarantee that a Session is thread-safe, so each
+        # calling thread gets its own session and keep-alive pool
+        self._local = threading.local()
+        self._sessions: List[Any] = []
+        self._sessions_lock = threading.Lock()
+
+    @property
+    def session(self):
+        """The calling thread's requests session, created on first use."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._new_session()
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def _new_session(self):
+        """Create a session with a pooled, retrying adapter and default headers."""
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        # Keep connections to the tunnel alive between calls and retry
+        # transient gateway errors; the advice endpoints have no side effects,
+        # so POSTs are safe to retry as well. A session is only used by one
+        # thread, so one pooled connection is enough
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=1,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=frozenset({"GET", "POST"})
+            )
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        # ngrok's browser warning page is only served to browser user agents,
+        # so no skip header is needed for this client
+        session.headers.update({
             'Content-Type': 'application/json',
-            'ngrok-skip-browser-warning': 'true'  # Skip ngrok browser warning
+            'Accept-Encoding': 'gzip, deflate'  # The API gzips larger responses
         })
+        if self.api_token:
+            session.headers['Authorization'] = f'Bearer {self.api_token}'
+        return session
+
+    def close(self) -> None:
+        """Close every thread's session and its pooled connections."""
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+        self._local = threading.local()
+
+    def __enter__(self) -> "AgricultureMCPClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _context(self, task: str, latitude: float, longitude: float) -> Dict[str, Any]:
+        """Build the agent context envelope sent with every query."""
+        return {
+            "timestamp": _utc_timestamp(),
+            "location": {"latitude": latitude, "longitude": longitude},
+            "current_task": task
+        }
+
+    def _post(self, url: str, data: Dict[str, Any]) -> Any:
+        """POST data as JSON and decode the reply; empty replies decode to {}."""
+        try:
+            response = self.session.post(url, json=data)
+            response.raise_for_status()
+            # 204 and other bodiless acks have nothing to decode
+            if not response.content:
+                return {}
+            return response.json()
+        except self.request_error as e:
+            return {"error": f"Request failed: {str(e)}"}
 
     def test_connection(self) -> Dict[str, Any]:
         """Test if the MCP server is accessible."""
@@ -53,21 +143,11 @@ class AgricultureMCPClient:
         """
         url = f"{self.base_url}/api/agent/initialize"
         data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "location": {
-                "latitude": latitude,
-                "longitude": longitude
-            },
-            "current_task": task,
+            **self._context(task, latitude, longitude),
             "confidence_threshold": 0.8
         }
 
-        try:
-            response = self.session.post(url, json=data)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            return {"error": f"Request failed: {str(e)}"}
+        return self._post(url, data)
 
     def get_crop_management_advice(
         self,
@@ -89,19 +169,10 @@ class AgricultureMCPClient:
                 "planting_season": season,
                 "field_history": []
             },
-            "context": {
-                "timestamp": datetime.utcnow().isoformat() + "Z",
-                "location": {"latitude": latitude, "longitude": longitude},
-                "current_task": "crop_management"
-            }
+            "context": self._context("crop_management", latitude, longitude)
         }
 
-        try:
-            response = self.session.post(url, json=data)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            return {"error": f"Request failed: {str(e)}"}
+        return self._post(url, data)
 
     def get_soil_analysis(
         self,
@@ -128,19 +199,10 @@ class AgricultureMCPClient:
                     }
                 }
             },
-            "context": {
-                "timestamp": datetime.utcnow().isoformat() + "Z",
-                "location": {"latitude": latitude, "longitude": longitude},
-                "current_task": "soil_analysis"
-            }
+            "context": self._context("soil_analysis", latitude, longitude)
         }
 
-        try:
-            response = self.session.post(url, json=data)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            return {"error": f"Request failed: {str(e)}"}
+        return self._post(url, data)
 
     def get_irrigation_schedule(
         self,
@@ -162,19 +224,10 @@ class AgricultureMCPClient:
                 "irrigation_method": irrigation_method,
                 "weather_forecast": "variable"
             },
-            "context": {
-                "timestamp": datetime.utcnow().isoformat() + "Z",
-                "location": {"latitude": latitude, "longitude": longitude},
-                "current_task": "irrigation_planning"
-            }
+            "context": self._context("irrigation_planning", latitude, longitude)
         }
 
-        try:
-            response = self.session.post(url, json=data)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            return {"error": f"Request failed: {str(e)}"}
+        return self._post(url, data)
 
     def get_pest_control_advice(
         self,
@@ -196,102 +249,140 @@ class AgricultureMCPClient:
                 "infestation_level": infestation_level,
                 "treatment_history": []
             },
-            "context": {
-                "timestamp": datetime.utcnow().isoformat() + "Z",
-                "location": {"latitude": latitude, "longitude": longitude},
-                "current_task": "pest_control"
-            }
+            "context": self._context("pest_control", latitude, longitude)
         }
 
-        try:
-            response = self.session.post(url, json=data)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            return {"error": f"Request failed: {str(e)}"}
+        return self._post(url, data)
+
+
+    def batch_execute(
+        self,
+        items: List[Dict[str, Any]],
+        latitude: float = 40.7128,
+        longitude: float = -74.0060,
+        task: str = "batch"
+    ) -> Any:
+        """
+        Run several agent tasks in one request against a shared context.
 
+        Args:
+            items: [{"task": "crop-management", "query": {...}}, ...]; task is
+                any agent task path such as "soil-analysis" or "pest-control"
+            latitude: Farm latitude
+            longitude: Farm longitude
+            task: Current farming task recorded in the shared context
+
+        Returns:
+            A list of agent responses in the same order as items
+        """
+        url = f"{self.base_url}/api/agent/batch"
+
+        data = {
+            "items": items,
+            "context": self._context(task, latitude, longitude)
+        }
 
-def demo_agriculture_mcp(ngrok_url: str):
+        return self._post(url, data)
+
+
+def _print_json(data: Any, pretty: bool) -> None:
+    """Print a response indented for reading, or compact on a single line."""
+    if pretty:
+        print(json.dumps(data, indent=2))
+    else:
+        print(json.dumps(data, separators=(",", ":")))
+
+
+def demo_agriculture_mcp(ngrok_url: str, pretty: bool = True):
     """
     Demonstrate the Agriculture MCP capabilities.
 
     Args:
         ngrok_url: Your ngrok tunnel URL (e.g., https://abc123.ngrok-free.app)
+        pretty: Indent printed responses; pass False for compact one-line
+            output when running the demo repeatedly or piping it elsewhere
     """
     print("🌾 Agriculture MCP Demo for Claude Integration")
     print("=" * 50)
 
-    client = AgricultureMCPClient(ngrok_url)
-
-    # Test connection
-    print("\n1. Testing connection...")
-    connection_test = client.test_connection()
-    if connection_test["success"]:
-        print("✅ Connected successfully!")
-        print(f"Response: {connection_test['data']}")
-    else:
-        print("❌ Connection failed!")
-        print(f"Error: {connection_test['error']}")
-        return
-
-    # Initialize context for a farm in Iowa
-    print("\n2. Initializing context for Iowa farm...")
-    iowa_lat, iowa_lon = 41.8781, -93.0977
-    context_result = client.initialize_context(
-        iowa_lat, iowa_lon, "comprehensive_planning")
-    print(json.dumps(context_result, indent=2))
-
-    # Get corn management advice
-    print("\n3. Getting corn management advice...")
-    corn_advice = client.get_crop_management_advice(
-        crop_type="corn",
-        soil_type="loam",
-        climate_zone="temperate",
-        season="spring",
-        latitude=iowa_lat,
-        longitude=iowa_lon
-    )
-    print(json.dumps(corn_advice, indent=2))
-
-    # Get soil analysis
-    print("\n4. Getting soil analysis...")
-    soil_analysis = client.get_soil_analysis(
-        ph_level=6.2,
-        organic_matter=3.5,
-        nitrogen=45.0,
-        phosphorus=25.0,
-        potassium=180.0,
-        latitude=iowa_lat,
-        longitude=iowa_lon
-    )
-    print(json.dumps(soil_analysis, indent=2))
-
-    # Get irrigation schedule
-    print("\n5. Getting irrigation schedule...")
-    irrigation_advice = client.get_irrigation_schedule(
-        crop_type="corn",
-        growth_stage="V8",
-        soil_moisture=65.0,
-        irrigation_method="center_pivot",
-        latitude=iowa_lat,
-        longitude=iowa_lon
-    )
-    print(json.dumps(irrigation_advice, indent=2))
-
-    # Get pest control advice
-    print("\n6. Getting pest control advice...")
-    pest_advice = client.get_pest_control_advice(
-        crop_type="corn",
-        growth_stage="V6",
-        pest_type="corn_borer",
-        infestation_level="low",
-        latitude=iowa_lat,
-        longitude=iowa_lon
-    )
-    print(json.dumps(pest_advice, indent=2))
-
-    print("\n🎉 Demo completed! Your MCP is ready for Claude integration.")
-    print("\nTo use with Claude, share your ngrok URL and ask Claude to help with farming decisions!")
+    with AgricultureMCPClient(ngrok_url) as client:
+        # Test connection
+        print("\n1. Testing connection...")
+        connection_test = client.test_connection()
+        if connection_test["success"]:
+            print("✅ Connected successfully!")
+            print(f"Response: {connection_test['data']}")
+        else:
+            print("❌ Connection failed!")
+            print(f"Error: {connection_test['error']}")
+            return
+
+        # Initialize context for a farm in Iowa
+        print("\n2. Initializing context for Iowa farm...")
+        iowa_lat, iowa_lon = 41.8781, -93.0977
+        context_result = client.initialize_context(
+            iowa_lat, iowa_lon, "comprehensive_planning")
+        _print_json(context_result, pretty)
+
+        # The advice queries are independent, so issue them concurrently and
+        # print the results in order once they arrive
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            corn_advice = pool.submit(
+                client.get_crop_management_advice,
+                crop_type="corn",
+                soil_type="loam",
+                climate_zone="temperate",
+                season="spring",
+                latitude=iowa_lat,
+                longitude=iowa_lon
+            )
+            soil_analysis = pool.submit(
+                client.get_soil_analysis,
+                ph_level=6.2,
+                organic_matter=3.5,
+                nitrogen=45.0,
+                phosphorus=25.0,
+                potassium=180.0,
+                latitude=iowa_lat,
+                longitude=iowa_lon
+            )
+            irrigation_advice = pool.submit(
+                client.get_irrigation_schedule,
+                crop_type="corn",
+                growth_stage="V8",
+                soil_moisture=65.0,
+                irrigation_method="center_pivot",
+                latitude=iowa_lat,
+                longitude=iowa_lon
+            )
+            pest_advice = pool.submit(
+                client.get_pest_control_advice,
+                crop_type="corn",
+                growth_stage="V6",
+                pest_type="corn_borer",
+                infestation_level="low",
+                latitude=iowa_lat,
+                longitude=iowa_lon
+            )
+
+        # Get corn management advice
+        print("\n3. Getting corn management advice...")
+        _print_json(corn_advice.result(), pretty)
+
+        # Get soil analysis
+        print("\n4. Getting soil analysis...")
+        _print_json(soil_analysis.result(), pretty)
+
+        # Get irrigation schedule
+        print("\n5. Getting irrigation schedule...")
+        _print_json(irrigation_advice.result(), pretty)
+
+        # Get pest control advice
+        print("\n6. Getting pest control advice...")
+        _print_json(pest_advice.result(), pretty)
+
+        print("\n🎉 Demo completed! Your MCP is ready for Claude integration.")
+        print("\nTo use with Claude, share your ngrok URL and ask Claude to help with farming decisions!")
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from typing import Optional
 
 
@@ -18,10 +19,12 @@ class Settings:
     WEATHER_COMPANY_BASE_URL: str = "https://api.weather.com/v2"
     WEATHER_API_TIMEOUT: int = 10  # seconds
     WEATHER_CACHE_TTL: int = 300   # 5 minutes in seconds
+    RESOURCE_CACHE_TTL: int = 300  # Rendered resource bodies stay fresh this long
+    RESOURCE_STALE_TTL: int = 300  # ...then are served stale while refreshing
     
     # Agricultural Data Configuration
-    DEFAULT_CROP_TYPES: list = ["corn", "wheat", "sunflower"]
-    DEFAULT_SOIL_TYPES: list = ["clay", "loam", "sandy", "silt"]
+    DEFAULT_CROP_TYPES: tuple[str, ...] = ("corn", "wheat", "sunflower")
+    DEFAULT_SOIL_TYPES: tuple[str, ...] = ("clay", "loam", "sandy", "silt")
     
     # Application Settings
     DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
@@ -35,4 +38,10 @@ class Settings:
         return bool(self.OPENWEATHER_API_KEY or self.AGROMONITORING_API_KEY)
 
 
-settings = Settings()
+@lru_cache()
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance."""
+    return Settings()
+
+
+settings = get_settings()
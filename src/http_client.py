@@ -0,0 +1,28 @@
+"""Shared outbound HTTP client for upstream weather API calls."""
+from typing import Optional
+
+import httpx
+
+from config import settings
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the process-wide pooled client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=10,
+                                max_connections=100),
+            timeout=httpx.Timeout(settings.WEATHER_API_TIMEOUT),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared client and its pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
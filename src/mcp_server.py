@@ -1,10 +1,13 @@
 import json
 import logging
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Literal
+from typing import Annotated, AsyncIterator, Dict, Final, List, Optional, Any, Literal
 
 from config import settings
+from http_client import close_client
 from fastmcp import FastMCP
+from pydantic import Field
 
 # Import Phase 2 components
 from models.location import GeoLocation
@@ -19,28 +22,112 @@ from resources.weather_resources import WeatherResources
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Release the pooled upstream connections when the server stops."""
+    try:
+        yield
+    finally:
+        await close_client()
+
+
 # Initialize FastMCP server
 mcp = FastMCP(
-    name=settings.MCP_SERVER_NAME
+    name=settings.MCP_SERVER_NAME,
+    lifespan=lifespan
 )
 
-# Initialize Phase 2 services
+# Initialize Phase 2 services; one WeatherService backs every tool and resource
 weather_service = WeatherService()
-weather_tools = WeatherTools()
-weather_resources = WeatherResources()
+weather_tools = WeatherTools(weather_service)
+weather_resources = WeatherResources(weather_service)
 
 # Mock data storage (in a real implementation, this would be a database)
 farms_data: Dict[str, Dict] = {}
 weather_cache: Dict[str, Dict] = {}
 crop_schedules: Dict[str, List[Dict]] = {}
 
+# Coordinate bounds, enforced by the validator FastMCP compiles for each tool
+Latitude = Annotated[float, Field(ge=-90, le=90)]
+Longitude = Annotated[float, Field(ge=-180, le=180)]
+
+# Static agronomy tables, built once at import rather than per tool call
+_CROP_ADVICE: Final = {
+    "corn": {
+        "soil_temp_min": 10,  # Celsius
+        "planting_depth": "1.5-2 inches",
+        "row_spacing": "30-36 inches",
+        "optimal_ph": "6.0-6.8"
+    },
+    "wheat": {
+        "soil_temp_min": 4,   # Celsius
+        "planting_depth": "1-2 inches",
+        "row_spacing": "6-8 inches",
+        "optimal_ph": "6.0-7.0"
+    },
+    "sunflower": {
+        "soil_temp_min": 10,  # Celsius
+        "planting_depth": "1.5-2.5 inches",
+        "row_spacing": "20-30 inches",
+        "optimal_ph": "6.0-7.5"
+    }
+}
+
+_SOIL_COMPATIBILITY: Final = {
+    "corn": {
+        "clay": "Good - retains moisture and nutrients well",
+        "loam": "Excellent - ideal growing medium",
+        "sandy": "Fair - may need more irrigation and fertilization",
+        "silt": "Good - good drainage and nutrient retention"
+    },
+    "wheat": {
+        "clay": "Good - retains moisture for winter varieties",
+        "loam": "Excellent - best overall performance",
+        "sandy": "Poor - may need significant amendments",
+        "silt": "Very good - excellent water and nutrient retention"
+    },
+    "sunflower": {
+        "clay": "Fair - ensure good drainage to prevent root rot",
+        "loam": "Excellent - optimal growing conditions",
+        "sandy": "Good - naturally well-draining",
+        "silt": "Good - adequate drainage with good nutrients"
+    }
+}
+
+_NEXT_STEPS: Final = (
+    "Test soil temperature and pH levels",
+    "Check current weather conditions",
+    "Monitor 7-day weather forecast",
+    "Prepare field with appropriate amendments",
+    "Ensure seed quality and treatment"
+)
+
+_SEASONAL_NOTES: Final = {
+    "corn": {
+        "spring": "Plant after last frost when soil reaches 10°C",
+        "summer": "Early summer planting possible in northern regions",
+        "fall": "Not recommended - insufficient growing season"
+    },
+    "wheat": {
+        "spring": "Plant early spring for spring wheat varieties",
+        "summer": "Not typical planting season",
+        "fall": "Ideal for winter wheat varieties"
+    },
+    "sunflower": {
+        "spring": "Plant after last frost, soil temperature 10°C+",
+        "summer": "Early summer planting possible",
+        "fall": "Not recommended - insufficient time to maturity"
+    }
+}
+
 # ==================== PHASE 2: WEATHER TOOLS ====================
 
 
 @mcp.tool
 async def get_current_weather_conditions(
-    latitude: float,
-    longitude: float
+    latitude: Latitude,
+    longitude: Longitude
 ) -> Dict[str, Any]:
     """
     Get current weather conditions for agricultural planning.
@@ -57,8 +144,8 @@ async def get_current_weather_conditions(
 
 @mcp.tool
 async def get_weather_forecast_analysis(
-    latitude: float,
-    longitude: float,
+    latitude: Latitude,
+    longitude: Longitude,
     days: int = 3
 ) -> Dict[str, Any]:
     """
@@ -77,8 +164,8 @@ async def get_weather_forecast_analysis(
 
 @mcp.tool
 async def get_soil_conditions(
-    latitude: float,
-    longitude: float
+    latitude: Latitude,
+    longitude: Longitude
 ) -> Dict[str, Any]:
     """
     Get soil temperature and moisture conditions for planting decisions.
@@ -105,8 +192,8 @@ async def test_connection() -> str:
 async def get_crop_planting_advice(
     crop_type: Literal["corn", "wheat", "sunflower"],
     soil_type: Literal["clay", "loam", "sandy", "silt"],
-    latitude: float,
-    longitude: float,
+    latitude: Latitude,
+    longitude: Longitude,
     planting_season: Literal["spring", "summer", "fall"]
 ) -> Dict[str, Any]:
     """
@@ -123,30 +210,6 @@ async def get_crop_planting_advice(
         Comprehensive planting advice including timing and recommendations
     """
 
-    # Basic crop-specific advice
-    crop_advice = {
-        "corn": {
-            "soil_temp_min": 10,  # Celsius
-            "planting_depth": "1.5-2 inches",
-            "row_spacing": "30-36 inches",
-            "optimal_ph": "6.0-6.8"
-        },
-        "wheat": {
-            "soil_temp_min": 4,   # Celsius
-            "planting_depth": "1-2 inches",
-            "row_spacing": "6-8 inches",
-            "optimal_ph": "6.0-7.0"
-        },
-        "sunflower": {
-            "soil_temp_min": 10,  # Celsius
-            "planting_depth": "1.5-2.5 inches",
-            "row_spacing": "20-30 inches",
-            "optimal_ph": "6.0-7.5"
-        }
-    }
-
-    advice = crop_advice[crop_type]
-
     # Get current weather conditions for enhanced recommendations
     try:
         current_weather = await weather_tools.get_current_weather_conditions(latitude, longitude)
@@ -161,70 +224,45 @@ async def get_crop_planting_advice(
         "location": {"latitude": latitude, "longitude": longitude},
         "soil_type": soil_type,
         "season": planting_season,
-        "recommendations": {
-            "minimum_soil_temperature": f"{advice['soil_temp_min']}°C",
-            "planting_depth": advice["planting_depth"],
-            "row_spacing": advice["row_spacing"],
-            "optimal_soil_ph": advice["optimal_ph"],
-            "soil_compatibility": _check_soil_compatibility(crop_type, soil_type),
-            "seasonal_notes": _get_seasonal_notes(crop_type, planting_season)
-        },
+        # Copies, so a caller mutating its result cannot alter the shared tables
+        "recommendations": dict(
+            _PLANTING_RECOMMENDATIONS[crop_type, soil_type, planting_season]),
         "current_conditions": weather_assessment,
-        "next_steps": [
-            "Test soil temperature and pH levels",
-            "Check current weather conditions",
-            "Monitor 7-day weather forecast",
-            "Prepare field with appropriate amendments",
-            "Ensure seed quality and treatment"
-        ]
+        "next_steps": list(_NEXT_STEPS)
     }
 
 
 def _check_soil_compatibility(crop_type: str, soil_type: str) -> str:
     """Check compatibility between crop and soil type"""
-    compatibility = {
-        "corn": {
-            "clay": "Good - retains moisture and nutrients well",
-            "loam": "Excellent - ideal growing medium",
-            "sandy": "Fair - may need more irrigation and fertilization",
-            "silt": "Good - good drainage and nutrient retention"
-        },
-        "wheat": {
-            "clay": "Good - retains moisture for winter varieties",
-            "loam": "Excellent - best overall performance",
-            "sandy": "Poor - may need significant amendments",
-            "silt": "Very good - excellent water and nutrient retention"
-        },
-        "sunflower": {
-            "clay": "Fair - ensure good drainage to prevent root rot",
-            "loam": "Excellent - optimal growing conditions",
-            "sandy": "Good - naturally well-draining",
-            "silt": "Good - adequate drainage with good nutrients"
-        }
-    }
-    return compatibility[crop_type][soil_type]
+    return _SOIL_COMPATIBILITY[crop_type][soil_type]
 
 
 def _get_seasonal_notes(crop_type: str, season: str) -> str:
     """Get season-specific planting notes"""
-    notes = {
-        "corn": {
-            "spring": "Plant after last frost when soil reaches 10°C",
-            "summer": "Early summer planting possible in northern regions",
-            "fall": "Not recommended - insufficient growing season"
-        },
-        "wheat": {
-            "spring": "Plant early spring for spring wheat varieties",
-            "summer": "Not typical planting season",
-            "fall": "Ideal for winter wheat varieties"
-        },
-        "sunflower": {
-            "spring": "Plant after last frost, soil temperature 10°C+",
-            "summer": "Early summer planting possible",
-            "fall": "Not recommended - insufficient time to maturity"
-        }
+    return _SEASONAL_NOTES[crop_type][season]
+
+
+def _planting_recommendations(crop_type: str, soil_type: str, season: str) -> Dict[str, str]:
+    """Build the static planting recommendations for one crop, soil and season"""
+    advice = _CROP_ADVICE[crop_type]
+    return {
+        "minimum_soil_temperature": f"{advice['soil_temp_min']}°C",
+        "planting_depth": advice["planting_depth"],
+        "row_spacing": advice["row_spacing"],
+        "optimal_soil_ph": advice["optimal_ph"],
+        "soil_compatibility": _check_soil_compatibility(crop_type, soil_type),
+        "seasonal_notes": _get_seasonal_notes(crop_type, season)
     }
-    return notes[crop_type][season]
+
+
+# Every (crop, soil, season) the tool accepts, resolved once at import; only
+# the location and live weather vary per call
+_PLANTING_RECOMMENDATIONS: Final = {
+    (crop, soil, season): _planting_recommendations(crop, soil, season)
+    for crop in _CROP_ADVICE
+    for soil in _SOIL_COMPATIBILITY[crop]
+    for season in _SEASONAL_NOTES[crop]
+}
 
 # ==================== PHASE 2: WEATHER RESOURCES ====================
 
@@ -357,7 +395,17 @@ if __name__ == "__main__":
 
         print(f"🚀 Starting Agriculture MCP Server on HTTP port {port}")
         print("🌾 Phase 2: Real weather integration enabled")
-        mcp.run(transport="http", port=port)
+        # Serve the ASGI app directly so uvicorn can pick uvloop/httptools
+        # ("auto") and skip per-request access logging
+        import uvicorn
+        uvicorn.run(
+            mcp.http_app(),
+            host="127.0.0.1",
+            port=port,
+            loop="auto",
+            http="auto",
+            access_log=False,
+        )
     else:
         # Default STDIO transport
         print("🚀 Starting Agriculture MCP Server with STDIO transport")
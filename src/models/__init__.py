@@ -1,10 +1,11 @@
 from .location import GeoLocation
-from .weather import WeatherCondition, WeatherForecast
+from .weather import DailySummary, WeatherCondition, WeatherForecast
 from .crop import CropType, GrowthStage, CropInfo
 from .schedule import FarmingActivity, FarmingSchedule
 
 __all__ = [
     'GeoLocation',
+    'DailySummary',
     'WeatherCondition',
     'WeatherForecast',
     'CropType',
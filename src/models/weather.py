@@ -1,5 +1,6 @@
-from datetime import datetime
-from typing import List, Optional
+from datetime import date, datetime
+from functools import cached_property
+from typing import Dict, List, Optional
 from pydantic import BaseModel, Field, ConfigDict
 
 
@@ -36,6 +37,42 @@ class WeatherCondition(BaseModel):
                                 description="Timestamp of the weather data")
 
 
+class DailySummary(BaseModel):
+    """Aggregated forecast conditions for one calendar day."""
+    day: date = Field(..., description="Forecast day (UTC)")
+    avg_temperature: float = Field(...,
+                                   description="Average temperature in Celsius")
+    total_precipitation: float = Field(..., ge=0,
+                                       description="Total precipitation in mm")
+    avg_humidity: float = Field(..., ge=0, le=100,
+                                description="Average relative humidity percentage")
+
+
+def summarize_daily(conditions: List[WeatherCondition]) -> List[DailySummary]:
+    """Aggregate conditions into per-day summaries in a single pass, oldest day first."""
+    # date -> [temperature sum, precipitation sum, humidity sum, count]
+    totals: Dict[date, List[float]] = {}
+    for condition in conditions:
+        day = condition.timestamp.date()
+        day_totals = totals.get(day)
+        if day_totals is None:
+            day_totals = totals[day] = [0.0, 0.0, 0.0, 0]
+        day_totals[0] += condition.temperature
+        day_totals[1] += condition.precipitation
+        day_totals[2] += condition.humidity
+        day_totals[3] += 1
+
+    return [
+        DailySummary(
+            day=day,
+            avg_temperature=temp_sum / count,
+            total_precipitation=precip_sum,
+            avg_humidity=humidity_sum / count
+        )
+        for day, (temp_sum, precip_sum, humidity_sum, count) in sorted(totals.items())
+    ]
+
+
 class WeatherForecast(BaseModel):
     """Weather forecast data for a specific location."""
     model_config = ConfigDict(
@@ -63,3 +100,8 @@ class WeatherForecast(BaseModel):
         ..., description="List of forecasted weather conditions")
     created_at: datetime = Field(
         default_factory=datetime.utcnow, description="Forecast creation timestamp")
+
+    @cached_property
+    def daily(self) -> List[DailySummary]:
+        """Per-day summaries of forecast_data, computed once on first use."""
+        return summarize_daily(self.forecast_data)
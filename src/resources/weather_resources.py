@@ -1,18 +1,64 @@
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Final, Optional
 import logging
 
+from config import settings
 from models.location import GeoLocation
+from services.cache import swr_cache
 from services.weather_service import WeatherService
 
 logger = logging.getLogger(__name__)
 
+# Crop-specific recommendations (this would be expanded with real data)
+_CROP_INFO: Final = {
+    "corn": {
+        "optimal_temp_range": "20-30°C",
+        "planting_season": "Spring (April-June)",
+        "soil_temp_requirement": "10°C+",
+        "growing_days": "90-120 days"
+    },
+    "wheat": {
+        "optimal_temp_range": "15-25°C",
+        "planting_season": "Fall (September-November) or Spring (March-May)",
+        "soil_temp_requirement": "4°C+",
+        "growing_days": "120-150 days"
+    },
+    "sunflower": {
+        "optimal_temp_range": "20-28°C",
+        "planting_season": "Late Spring (May-June)",
+        "soil_temp_requirement": "12°C+",
+        "growing_days": "80-120 days"
+    }
+}
+
+# Per crop: minimum soil temperature, air temperature range, and the advice
+# for soil too cold, air temperature in range, and out of range
+_PLANTING_RULES: Final = {
+    "corn": (10, float("-inf"), 30,
+             "Wait - soil temperature too low for corn planting",
+             "Good conditions for corn planting",
+             "Consider waiting for cooler weather"),
+    "wheat": (4, 15, 25,
+              "Wait - soil temperature too low for wheat",
+              "Excellent conditions for wheat planting",
+              "Acceptable conditions for wheat planting"),
+    "sunflower": (12, 20, 28,
+                  "Wait - soil temperature too low for sunflowers",
+                  "Ideal conditions for sunflower planting",
+                  "Acceptable conditions for sunflower planting")
+}
+
+
+class _EstimatedOnly(Exception):
+    """Raised by a cached renderer when only estimated weather is available."""
+
 
 class WeatherResources:
     """Weather-related MCP resources for agricultural data access."""
 
-    def __init__(self):
-        self.weather_service = WeatherService()
+    def __init__(self, weather_service: Optional[WeatherService] = None):
+        # Share the server's service so its cache and pooled client are reused
+        self.weather_service = weather_service or WeatherService()
 
     async def get_current_weather_resource(
         self,
@@ -24,25 +70,11 @@ class WeatherResources:
         Used by agricultural planning tools and recommendations.
         """
         try:
+            return await self._render_current_weather(latitude, longitude)
+        except _EstimatedOnly:
             location = GeoLocation(latitude=latitude, longitude=longitude)
-            weather = await self.weather_service.get_current_weather(location)
-
-            return f"""
-Current Weather Conditions for {latitude}, {longitude}:
-
-🌡️  Temperature: {weather.temperature}°C
-💧  Humidity: {weather.humidity}%
-🌧️  Precipitation: {weather.precipitation}mm
-💨  Wind: {weather.wind_speed} m/s from {weather.wind_direction}°
-🌱  Soil Temperature: {weather.soil_temperature or 'N/A'}°C
-🪣  Soil Moisture: {weather.soil_moisture or 'N/A'}%
-📅  Updated: {weather.timestamp.strftime('%Y-%m-%d %H:%M UTC')}
-
-Agricultural Assessment:
-- Planting Conditions: {_assess_planting_conditions(weather)}
-- Irrigation Status: {_assess_irrigation_need(weather)}
-- Field Work: {_assess_field_work_conditions(weather)}
-"""
+            weather = self.weather_service.estimate_current_weather(location)
+            return _format_current_weather(latitude, longitude, weather)
         except Exception as e:
             logger.error(f"Error getting weather resource: {e}")
             return f"Error retrieving weather data: {str(e)}"
@@ -57,45 +89,11 @@ Agricultural Assessment:
         Provides weather forecast for agricultural planning.
         """
         try:
+            return await self._render_weather_forecast(latitude, longitude, days)
+        except _EstimatedOnly:
             location = GeoLocation(latitude=latitude, longitude=longitude)
-            forecast = await self.weather_service.get_weather_forecast(location, days)
-
-            result = f"Weather Forecast for {latitude}, {longitude} ({days} days):\n\n"
-
-            # Group by day and show daily summary
-            daily_data = {}
-            for condition in forecast.forecast_data:
-                date_key = condition.timestamp.date()
-                if date_key not in daily_data:
-                    daily_data[date_key] = []
-                daily_data[date_key].append(condition)
-
-            for date, conditions in sorted(daily_data.items()):
-                avg_temp = sum(
-                    c.temperature for c in conditions) / len(conditions)
-                total_precip = sum(c.precipitation for c in conditions)
-                avg_humidity = sum(
-                    c.humidity for c in conditions) / len(conditions)
-
-                result += f"""📅 {date.strftime('%Y-%m-%d')}:
-   🌡️  Avg Temperature: {avg_temp:.1f}°C
-   🌧️  Total Precipitation: {total_precip:.1f}mm
-   💧  Avg Humidity: {avg_humidity:.1f}%
-   
-"""
-
-            # Add agricultural recommendations
-            total_rain = sum(c.precipitation for c in forecast.forecast_data)
-            result += f"""
-🚜 Agricultural Outlook:
-- Total Expected Rainfall: {total_rain:.1f}mm
-- Irrigation Needs: {'Low' if total_rain > 15 else 'Moderate to High'}
-- Field Work Windows: Check individual days for dry periods
-- Planting Conditions: Monitor daily temperatures and moisture
-"""
-
-            return result
-
+            forecast = self.weather_service.estimate_weather_forecast(location, days)
+            return _format_weather_forecast(latitude, longitude, days, forecast)
         except Exception as e:
             logger.error(f"Error getting forecast resource: {e}")
             return f"Error retrieving forecast data: {str(e)}"
@@ -110,35 +108,95 @@ Agricultural Assessment:
         Provides crop planting calendar based on location and weather patterns.
         """
         try:
-            # Get current weather to assess conditions
+            return await self._render_crop_calendar(crop_type, latitude, longitude)
+        except _EstimatedOnly:
             location = GeoLocation(latitude=latitude, longitude=longitude)
-            current_weather = await self.weather_service.get_current_weather(location)
-
-            # Crop-specific recommendations (this would be expanded with real data)
-            crop_info = {
-                "corn": {
-                    "optimal_temp_range": "20-30°C",
-                    "planting_season": "Spring (April-June)",
-                    "soil_temp_requirement": "10°C+",
-                    "growing_days": "90-120 days"
-                },
-                "wheat": {
-                    "optimal_temp_range": "15-25°C",
-                    "planting_season": "Fall (September-November) or Spring (March-May)",
-                    "soil_temp_requirement": "4°C+",
-                    "growing_days": "120-150 days"
-                },
-                "sunflower": {
-                    "optimal_temp_range": "20-28°C",
-                    "planting_season": "Late Spring (May-June)",
-                    "soil_temp_requirement": "12°C+",
-                    "growing_days": "80-120 days"
-                }
-            }
-
-            info = crop_info.get(crop_type.lower(), crop_info["corn"])
-
-            return f"""
+            weather = self.weather_service.estimate_current_weather(location)
+            return _format_crop_calendar(crop_type, latitude, longitude, weather)
+        except Exception as e:
+            logger.error(f"Error getting crop calendar resource: {e}")
+            return f"Error retrieving crop calendar: {str(e)}"
+
+    # Only renders of observed data are cached: errors and estimates raise
+    # out of these methods, so swr_cache never stores them
+
+    @swr_cache(settings.RESOURCE_CACHE_TTL, settings.RESOURCE_STALE_TTL)
+    async def _render_current_weather(self, latitude: float, longitude: float) -> str:
+        location = GeoLocation(latitude=latitude, longitude=longitude)
+        weather = await self.weather_service.get_current_weather(location, fallback=False)
+        if weather is None:
+            raise _EstimatedOnly("upstream weather unavailable")
+        return _format_current_weather(latitude, longitude, weather)
+
+    @swr_cache(settings.RESOURCE_CACHE_TTL, settings.RESOURCE_STALE_TTL)
+    async def _render_weather_forecast(self, latitude: float, longitude: float, days: int) -> str:
+        location = GeoLocation(latitude=latitude, longitude=longitude)
+        forecast = await self.weather_service.get_weather_forecast(
+            location, days, fallback=False)
+        if forecast is None:
+            raise _EstimatedOnly("upstream weather unavailable")
+        return _format_weather_forecast(latitude, longitude, days, forecast)
+
+    @swr_cache(settings.RESOURCE_CACHE_TTL, settings.RESOURCE_STALE_TTL)
+    async def _render_crop_calendar(self, crop_type: str, latitude: float, longitude: float) -> str:
+        location = GeoLocation(latitude=latitude, longitude=longitude)
+        weather = await self.weather_service.get_current_weather(location, fallback=False)
+        if weather is None:
+            raise _EstimatedOnly("upstream weather unavailable")
+        return _format_crop_calendar(crop_type, latitude, longitude, weather)
+
+
+def _format_current_weather(latitude: float, longitude: float, weather) -> str:
+    """Render current conditions with their agricultural assessment."""
+    return f"""
+Current Weather Conditions for {latitude}, {longitude}:
+
+🌡️  Temperature: {weather.temperature}°C
+💧  Humidity: {weather.humidity}%
+🌧️  Precipitation: {weather.precipitation}mm
+💨  Wind: {weather.wind_speed} m/s from {weather.wind_direction}°
+🌱  Soil Temperature: {weather.soil_temperature or 'N/A'}°C
+🪣  Soil Moisture: {weather.soil_moisture or 'N/A'}%
+📅  Updated: {weather.timestamp.strftime('%Y-%m-%d %H:%M UTC')}
+
+Agricultural Assessment:
+- Planting Conditions: {_assess_planting_conditions(weather)}
+- Irrigation Status: {_assess_irrigation_need(weather)}
+- Field Work: {_assess_field_work_conditions(weather)}
+"""
+
+
+def _format_weather_forecast(latitude: float, longitude: float, days: int, forecast) -> str:
+    """Render a forecast as daily summaries followed by an agricultural outlook."""
+    parts = [f"Weather Forecast for {latitude}, {longitude} ({days} days):\n\n"]
+
+    for summary in forecast.daily:
+        parts.append(f"""📅 {summary.day.strftime('%Y-%m-%d')}:
+   🌡️  Avg Temperature: {summary.avg_temperature:.1f}°C
+   🌧️  Total Precipitation: {summary.total_precipitation:.1f}mm
+   💧  Avg Humidity: {summary.avg_humidity:.1f}%
+   
+""")
+
+    # Add agricultural recommendations
+    total_rain = sum(summary.total_precipitation for summary in forecast.daily)
+    parts.append(f"""
+🚜 Agricultural Outlook:
+- Total Expected Rainfall: {total_rain:.1f}mm
+- Irrigation Needs: {'Low' if total_rain > 15 else 'Moderate to High'}
+- Field Work Windows: Check individual days for dry periods
+- Planting Conditions: Monitor daily temperatures and moisture
+""")
+
+    return "".join(parts)
+
+
+def _format_crop_calendar(crop_type: str, latitude: float, longitude: float, weather) -> str:
+    """Render the crop calendar for crop_type against current conditions."""
+    crop = crop_type.lower()
+    info = _CROP_INFO.get(crop, _CROP_INFO["corn"])
+
+    return f"""
 🌾 Crop Calendar for {crop_type.title()} at {latitude}, {longitude}:
 
 📋 Crop Information:
@@ -148,12 +206,12 @@ Agricultural Assessment:
 - Growing Period: {info['growing_days']}
 
 🌡️ Current Conditions:
-- Air Temperature: {current_weather.temperature}°C
-- Soil Temperature: {current_weather.soil_temperature or 'N/A'}°C
-- Soil Moisture: {current_weather.soil_moisture or 'N/A'}%
+- Air Temperature: {weather.temperature}°C
+- Soil Temperature: {weather.soil_temperature or 'N/A'}°C
+- Soil Moisture: {weather.soil_moisture or 'N/A'}%
 
 📅 Planting Recommendation:
-{_get_planting_recommendation(crop_type, current_weather)}
+{_get_planting_recommendation(crop, weather)}
 
 🔔 Next Steps:
 1. Monitor soil temperature trends
@@ -162,10 +220,6 @@ Agricultural Assessment:
 4. Plan irrigation schedule based on precipitation forecast
 """
 
-        except Exception as e:
-            logger.error(f"Error getting crop calendar resource: {e}")
-            return f"Error retrieving crop calendar: {str(e)}"
-
 
 # Helper functions (reused from tools)
 def _assess_planting_conditions(weather) -> str:
@@ -203,30 +257,18 @@ def _assess_field_work_conditions(weather) -> str:
 
 
 def _get_planting_recommendation(crop_type: str, weather) -> str:
-    """Get planting recommendation for specific crop."""
+    """Get planting recommendation for specific crop; crop_type is lower case."""
+    rules = _PLANTING_RULES.get(crop_type)
+    if rules is None:
+        return "Monitor temperature and soil conditions for optimal planting"
+
+    min_soil_temp, temp_low, temp_high, too_cold, in_range, out_of_range = rules
     temp = weather.temperature
     soil_temp = weather.soil_temperature or temp - 2
 
-    if crop_type.lower() == "corn":
-        if soil_temp < 10:
-            return "Wait - soil temperature too low for corn planting"
-        elif temp > 30:
-            return "Consider waiting for cooler weather"
-        else:
-            return "Good conditions for corn planting"
-    elif crop_type.lower() == "wheat":
-        if soil_temp < 4:
-            return "Wait - soil temperature too low for wheat"
-        elif 15 <= temp <= 25:
-            return "Excellent conditions for wheat planting"
-        else:
-            return "Acceptable conditions for wheat planting"
-    elif crop_type.lower() == "sunflower":
-        if soil_temp < 12:
-            return "Wait - soil temperature too low for sunflowers"
-        elif 20 <= temp <= 28:
-            return "Ideal conditions for sunflower planting"
-        else:
-            return "Acceptable conditions for sunflower planting"
+    if soil_temp < min_soil_temp:
+        return too_cold
+    elif temp_low <= temp <= temp_high:
+        return in_range
     else:
-        return "Monitor temperature and soil conditions for optimal planting"
+        return out_of_range
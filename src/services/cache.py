@@ -0,0 +1,83 @@
+"""In-process caching primitives."""
+import asyncio
+import functools
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+from services import singleflight
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """Dict-backed cache whose entries expire after a per-entry TTL."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._data.pop(key, None)
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store value under key for ttl seconds, evicting the oldest entry when full."""
+        if key not in self._data and len(self._data) >= self.maxsize:
+            self._data.pop(next(iter(self._data)))
+        self._data[key] = (time.monotonic() + ttl, value)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def swr_cache(ttl: float, stale: float, maxsize: int = 1024):
+    """
+    Cache an async function's results per argument list (stale-while-revalidate).
+
+    Results are fresh for ttl seconds. For a further stale seconds the cached
+    result is still returned immediately while one background call refreshes
+    it; after that the next caller waits for a new result.
+    """
+    def decorator(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        cache = TTLCache(maxsize=maxsize)
+        refreshing: Dict[str, "asyncio.Task[Any]"] = {}
+
+        async def load(key: str, args: tuple, kwargs: dict) -> Any:
+            value = await fn(*args, **kwargs)
+            cache.set(key, (value, time.monotonic()), ttl + stale)
+            return value
+
+        async def refresh(key: str, args: tuple, kwargs: dict) -> None:
+            try:
+                await singleflight.do(key, lambda: load(key, args, kwargs))
+            except Exception as e:
+                logger.warning(f"Background refresh of {fn.__qualname__} failed: {e}")
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            key = f"{fn.__qualname__}:{args!r}:{kwargs!r}"
+            entry = cache.get(key)
+            if entry is None:
+                return await singleflight.do(key, lambda: load(key, args, kwargs))
+
+            value, cached_at = entry
+            if time.monotonic() - cached_at > ttl and key not in refreshing:
+                task = asyncio.ensure_future(refresh(key, args, kwargs))
+                refreshing[key] = task
+                task.add_done_callback(lambda _: refreshing.pop(key, None))
+            return value
+
+        return wrapper
+
+    return decorator
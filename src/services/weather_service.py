@@ -6,10 +6,18 @@ import logging
 from models.weather import WeatherCondition, WeatherForecast
 from models.location import GeoLocation
 from config import settings
+from http_client import get_client
+from services.cache import TTLCache
+from services import singleflight
 
 logger = logging.getLogger(__name__)
 
 
+def _grid_key(location: GeoLocation) -> str:
+    """Coordinates rounded to ~1 km, so nearby points share upstream results."""
+    return f"{location.latitude:.2f},{location.longitude:.2f}"
+
+
 class WeatherService:
     """Service for retrieving weather data from external APIs."""
 
@@ -20,118 +28,168 @@ class WeatherService:
         self.weather_base_url = getattr(
             settings, 'WEATHER_COMPANY_BASE_URL', 'https://api.weather.com/v1')
         self.timeout = 30.0
+        # Parsed observations by grid cell; WEATHER_CACHE_TTL is kept to half
+        # the provider's ~10 minute update interval
+        self._current_cache = TTLCache(maxsize=1024)
+
+    async def get_current_weather(
+        self,
+        location: GeoLocation,
+        fallback: bool = True
+    ) -> Optional[WeatherCondition]:
+        """
+        Get current weather conditions for a location.
 
-    async def get_current_weather(self, location: GeoLocation) -> WeatherCondition:
-        """Get current weather conditions for a location."""
+        When the upstream request fails, estimated conditions are returned, or
+        None if fallback is False.
+        """
+        key = _grid_key(location)
+        weather = self._current_cache.get(key)
+        if weather is None:
+            # Concurrent misses for the same cell share one upstream request
+            weather = await singleflight.do(
+                f"cw:{key}", lambda: self._fetch_current_weather(location))
+            if weather is None:
+                return self.estimate_current_weather(location) if fallback else None
+            self._current_cache.set(key, weather, settings.WEATHER_CACHE_TTL)
+        return weather
+
+    async def _fetch_current_weather(self, location: GeoLocation) -> Optional[WeatherCondition]:
+        """Fetch current conditions upstream, or None if the request fails."""
         try:
             # Use OpenWeatherMap API (compatible with AgroMonitoring structure)
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                params = {
-                    "lat": location.latitude,
-                    "lon": location.longitude,
-                    "appid": self.agro_api_key,
-                    "units": "metric"
-                }
-
-                # Try AgroMonitoring first, fallback to OpenWeatherMap format
-                base_url = self.agro_base_url.replace("/agro/1.0", "/data/2.5")
-                response = await client.get(
-                    f"{base_url}/weather",
-                    params=params
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                return WeatherCondition(
-                    temperature=data["main"]["temp"],
-                    humidity=data["main"]["humidity"],
-                    precipitation=data.get("rain", {}).get("1h", 0.0),
-                    wind_speed=data["wind"]["speed"],
-                    wind_direction=data["wind"]["deg"],
-                    soil_temperature=data["main"]["temp"] - 2.0,  # Estimate
-                    soil_moisture=max(
-                        # Estimate
-                        0, min(100, data["main"]["humidity"] * 0.7)),
-                    timestamp=datetime.utcfromtimestamp(data["dt"])
-                )
+            client = get_client()
+            params = {
+                "lat": location.latitude,
+                "lon": location.longitude,
+                "appid": self.agro_api_key,
+                "units": "metric"
+            }
+
+            # Try AgroMonitoring first, fallback to OpenWeatherMap format
+            base_url = self.agro_base_url.replace("/agro/1.0", "/data/2.5")
+            response = await client.get(
+                f"{base_url}/weather",
+                params=params,
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            return WeatherCondition(
+                temperature=data["main"]["temp"],
+                humidity=data["main"]["humidity"],
+                precipitation=data.get("rain", {}).get("1h", 0.0),
+                wind_speed=data["wind"]["speed"],
+                wind_direction=data["wind"]["deg"],
+                soil_temperature=data["main"]["temp"] - 2.0,  # Estimate
+                soil_moisture=max(
+                    # Estimate
+                    0, min(100, data["main"]["humidity"] * 0.7)),
+                timestamp=datetime.utcfromtimestamp(data["dt"])
+            )
         except httpx.HTTPError as e:
             logger.error(f"HTTP error getting current weather: {e}")
-            # Return fallback data instead of raising
-            return self._get_fallback_weather(location)
+            # The caller falls back to estimated data, which is not cached
+            return None
         except Exception as e:
             logger.error(f"Error getting current weather: {e}")
-            return self._get_fallback_weather(location)
+            return None
 
     async def get_weather_forecast(
         self,
         location: GeoLocation,
-        days: int = 7
-    ) -> WeatherForecast:
-        """Get weather forecast for a location."""
+        days: int = 7,
+        fallback: bool = True
+    ) -> Optional[WeatherForecast]:
+        """
+        Get weather forecast for a location.
+
+        When the upstream request fails, an estimated forecast is returned, or
+        None if fallback is False.
+        """
+        # Concurrent requests for the same cell share one upstream request
+        forecast = await singleflight.do(
+            f"fc:{_grid_key(location)}:{days}",
+            lambda: self._fetch_weather_forecast(location, days))
+        if forecast is None:
+            return self.estimate_weather_forecast(location, days) if fallback else None
+        # The shared result carries the first caller's coordinates
+        return forecast.model_copy(update={
+            "location_id": f"{location.latitude},{location.longitude}"})
+
+    async def _fetch_weather_forecast(
+        self,
+        location: GeoLocation,
+        days: int
+    ) -> Optional[WeatherForecast]:
+        """Fetch a forecast upstream, or None if the request fails."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                params = {
-                    "lat": location.latitude,
-                    "lon": location.longitude,
-                    "appid": self.agro_api_key,
-                    # 3-hour forecasts, max 40 (5 days)
-                    "cnt": min(days * 8, 40),
-                    "units": "metric"
-                }
-
-                base_url = self.agro_base_url.replace("/agro/1.0", "/data/2.5")
-                response = await client.get(
-                    f"{base_url}/forecast",
-                    params=params
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                forecast_data = []
-                for item in data["list"]:
-                    forecast_data.append(
-                        WeatherCondition(
-                            temperature=item["main"]["temp"],
-                            humidity=item["main"]["humidity"],
-                            precipitation=item.get("rain", {}).get("3h", 0.0),
-                            wind_speed=item["wind"]["speed"],
-                            wind_direction=item["wind"]["deg"],
+            client = get_client()
+            params = {
+                "lat": location.latitude,
+                "lon": location.longitude,
+                "appid": self.agro_api_key,
+                # 3-hour forecasts, max 40 (5 days)
+                "cnt": min(days * 8, 40),
+                "units": "metric"
+            }
+
+            base_url = self.agro_base_url.replace("/agro/1.0", "/data/2.5")
+            response = await client.get(
+                f"{base_url}/forecast",
+                params=params,
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            forecast_data = []
+            for item in data["list"]:
+                forecast_data.append(
+                    WeatherCondition(
+                        temperature=item["main"]["temp"],
+                        humidity=item["main"]["humidity"],
+                        precipitation=item.get("rain", {}).get("3h", 0.0),
+                        wind_speed=item["wind"]["speed"],
+                        wind_direction=item["wind"]["deg"],
+                        # Estimate
+                        soil_temperature=item["main"]["temp"] - 2.0,
+                        soil_moisture=max(
                             # Estimate
-                            soil_temperature=item["main"]["temp"] - 2.0,
-                            soil_moisture=max(
-                                # Estimate
-                                0, min(100, item["main"]["humidity"] * 0.7)),
-                            timestamp=datetime.utcfromtimestamp(item["dt"])
-                        )
+                            0, min(100, item["main"]["humidity"] * 0.7)),
+                        timestamp=datetime.utcfromtimestamp(item["dt"])
                     )
-
-                return WeatherForecast(
-                    location_id=f"{location.latitude},{location.longitude}",
-                    forecast_data=forecast_data
                 )
+
+            return WeatherForecast(
+                location_id=f"{location.latitude},{location.longitude}",
+                forecast_data=forecast_data
+            )
         except httpx.HTTPError as e:
             logger.error(f"HTTP error getting weather forecast: {e}")
-            return self._get_fallback_forecast(location, days)
+            return None
         except Exception as e:
             logger.error(f"Error getting weather forecast: {e}")
-            return self._get_fallback_forecast(location, days)
+            return None
 
     async def get_soil_data(self, location: GeoLocation) -> Dict[str, Any]:
         """Get soil data for a location."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                params = {
-                    "lat": location.latitude,
-                    "lon": location.longitude,
-                    "appid": self.agro_api_key
-                }
-
-                response = await client.get(
-                    f"{self.agro_base_url}/soil",
-                    params=params
-                )
-                response.raise_for_status()
-                return response.json()
+            client = get_client()
+            params = {
+                "lat": location.latitude,
+                "lon": location.longitude,
+                "appid": self.agro_api_key
+            }
+
+            response = await client.get(
+                f"{self.agro_base_url}/soil",
+                params=params,
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            return response.json()
         except httpx.HTTPError as e:
             logger.error(f"HTTP error getting soil data: {e}")
             return self._get_fallback_soil_data(location)
@@ -142,23 +200,24 @@ class WeatherService:
     async def health_check(self) -> bool:
         """Check if weather service is available."""
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                # Simple check with default location
-                params = {
-                    "lat": 0.0,
-                    "lon": 0.0,
-                    "appid": self.agro_api_key
-                }
-                base_url = self.agro_base_url.replace("/agro/1.0", "/data/2.5")
-                response = await client.get(
-                    f"{base_url}/weather",
-                    params=params
-                )
-                return response.status_code == 200
+            client = get_client()
+            # Simple check with default location
+            params = {
+                "lat": 0.0,
+                "lon": 0.0,
+                "appid": self.agro_api_key
+            }
+            base_url = self.agro_base_url.replace("/agro/1.0", "/data/2.5")
+            response = await client.get(
+                f"{base_url}/weather",
+                params=params,
+                timeout=5.0
+            )
+            return response.status_code == 200
         except Exception:
             return False
 
-    def _get_fallback_weather(self, location: GeoLocation) -> WeatherCondition:
+    def estimate_current_weather(self, location: GeoLocation) -> WeatherCondition:
         """Generate realistic fallback weather data."""
         # Generate realistic temperature based on latitude and season
         import math
@@ -183,10 +242,10 @@ class WeatherService:
             timestamp=datetime.utcnow()
         )
 
-    def _get_fallback_forecast(self, location: GeoLocation, days: int) -> WeatherForecast:
+    def estimate_weather_forecast(self, location: GeoLocation, days: int) -> WeatherForecast:
         """Generate realistic fallback forecast data."""
         forecast_data = []
-        base_weather = self._get_fallback_weather(location)
+        base_weather = self.estimate_current_weather(location)
 
         for i in range(days * 8):  # 3-hour intervals
             # Add some variation to make it realistic
@@ -1,4 +1,4 @@
-from typing import Literal, Dict, Any
+from typing import Literal, Dict, Any, Optional
 import json
 import logging
 
@@ -12,8 +12,9 @@ logger = logging.getLogger(__name__)
 class WeatherTools:
     """Weather-related MCP tools for agricultural planning."""
 
-    def __init__(self):
-        self.weather_service = WeatherService()
+    def __init__(self, weather_service: Optional[WeatherService] = None):
+        # Share the server's service so its cache and pooled client are reused
+        self.weather_service = weather_service or WeatherService()
 
     async def get_current_weather_conditions(
         self,
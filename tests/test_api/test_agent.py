@@ -0,0 +1,81 @@
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+CONTEXT = {
+    "timestamp": "2025-09-07T12:00:00Z",
+    "location": {"latitude": 41.8781, "longitude": -93.0977}
+}
+SOIL_QUERY = {
+    "ph_level": 6.2,
+    "organic_matter": 3.5,
+    "nitrogen": 45.0,
+    "phosphorus": 25.0,
+    "potassium": 180.0,
+    "soil_moisture": 40.0
+}
+
+
+def test_task_route_dispatches_to_handler():
+    with TestClient(app) as client:
+        response = client.post(
+            "/api/agent/soil-analysis",
+            json={"query": SOIL_QUERY, "context": CONTEXT})
+
+    assert response.status_code == 200
+    assert response.json()["action_taken"]["action_type"] == "soil_analysis"
+
+
+def test_task_route_rejects_invalid_query():
+    with TestClient(app) as client:
+        response = client.post(
+            "/api/agent/soil-analysis",
+            json={"query": {**SOIL_QUERY, "ph_level": 15}, "context": CONTEXT})
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "query", "ph_level"]
+
+
+def test_batch_returns_responses_in_item_order():
+    items = [
+        {"task": "soil-analysis", "query": SOIL_QUERY},
+        {"task": "pest-control", "query": {
+            "pest_type": "corn_borer",
+            "infestation_level": 2,
+            "crop_stage": "V6",
+            "temperature": 24.0,
+            "humidity": 60.0
+        }},
+    ]
+    with TestClient(app) as client:
+        response = client.post(
+            "/api/agent/batch", json={"items": items, "context": CONTEXT})
+
+    assert response.status_code == 200
+    assert [r["action_taken"]["action_type"] for r in response.json()] == [
+        "soil_analysis", "pest_control"]
+
+
+def test_batch_validates_each_query_against_its_task():
+    items = [
+        {"task": "crop-management", "query": SOIL_QUERY},
+        {"task": "soil-analysis", "query": {**SOIL_QUERY, "ph_level": 15}},
+    ]
+    with TestClient(app) as client:
+        response = client.post(
+            "/api/agent/batch", json={"items": items, "context": CONTEXT})
+
+    assert response.status_code == 422
+    locs = [error["loc"] for error in response.json()["detail"]]
+    assert ["body", "items", 1, "soil-analysis", "query", "ph_level"] in locs
+    assert all(loc[:4] == ["body", "items", 0, "crop-management"]
+               for loc in locs if loc[2] == 0)
+
+
+def test_task_route_documents_each_query_schema():
+    body = app.openapi()["paths"]["/api/agent/{task}"]["post"]["requestBody"]
+    query = body["content"]["application/json"]["schema"]["properties"]["query"]
+
+    assert [schema["title"] for schema in query["oneOf"]] == [
+        "CropManagementQuery", "SoilAnalysisQuery", "PestControlQuery",
+        "IrrigationScheduleQuery", "HarvestTimingQuery"]
@@ -0,0 +1,68 @@
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.api import cache
+from app.api.cache import cached, response_cache
+from app.core import cache as ttl_cache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now[0])
+    response_cache.clear()
+    yield now
+    response_cache.clear()
+
+
+def _client(status_code: int):
+    """An app whose single cached route counts calls and fails with status_code."""
+    calls = []
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    @cached(expire=60, key_builder=lambda kw: ("test:items", kw["item_id"]))
+    async def get_item(item_id: str):
+        calls.append(item_id)
+        if status_code >= 400:
+            raise HTTPException(status_code=status_code, detail=f"failure {len(calls)}")
+        return {"item_id": item_id, "call": len(calls)}
+
+    return TestClient(app), calls
+
+
+def test_identical_request_is_served_from_cache(clock):
+    client, calls = _client(200)
+
+    first = client.get("/items/a")
+    second = client.get("/items/a")
+
+    assert first.json() == second.json() == {"item_id": "a", "call": 1}
+    assert calls == ["a"]
+
+
+def test_server_error_is_replayed_until_error_ttl(clock):
+    client, calls = _client(503)
+
+    first = client.get("/items/a")
+    clock[0] += cache.settings.ERROR_CACHE_TTL - 1
+    replayed = client.get("/items/a")
+    clock[0] += 1
+    retried = client.get("/items/a")
+
+    assert first.status_code == replayed.status_code == 503
+    assert first.json() == replayed.json() == {"detail": "failure 1"}
+    assert retried.json() == {"detail": "failure 2"}
+    assert calls == ["a", "a"]
+
+
+def test_client_error_is_not_cached(clock):
+    client, calls = _client(404)
+
+    first = client.get("/items/a")
+    second = client.get("/items/a")
+
+    assert first.status_code == second.status_code == 404
+    assert second.json() == {"detail": "failure 2"}
+    assert calls == ["a", "a"]
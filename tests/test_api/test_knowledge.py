@@ -0,0 +1,38 @@
+import httpx
+from fastapi.testclient import TestClient
+
+import app.main as main
+
+
+def test_forecast_disease_risks_evaluates_each_period(monkeypatch):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json={"list": [
+            {
+                "main": {"temp": temperature, "humidity": humidity},
+                "wind": {"speed": 2.0, "deg": 90},
+                "dt": 1780272000 + i * 10800
+            }
+            for i, (temperature, humidity) in enumerate(
+                [(10.0, 40.0), (20.0, 65.0), (18.0, 75.0)])
+        ]})
+
+    monkeypatch.setattr(main, "create_clients", lambda: httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)))
+    with TestClient(main.app) as client:
+        response = client.get(
+            "/api/knowledge/disease-risks/wheat/forecast/45.52,-122.68",
+            params={"days": 1})
+
+    assert response.status_code == 200
+    assert [
+        (risk["disease"], risk["risk_periods"], risk["first_risk_at"])
+        for risk in response.json()
+    ] == [
+        ("black_rust", 2, "2026-06-01T03:00:00Z"),
+        ("smut", 1, "2026-06-01T06:00:00Z"),
+        ("powdery_mildew", 2, "2026-06-01T03:00:00Z"),
+    ]
+    assert len(calls) == 1
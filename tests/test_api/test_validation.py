@@ -64,7 +64,7 @@ def test_soil_analysis_validation():
     # Test invalid NPK levels
     invalid_soil = valid_soil.copy()
     invalid_soil["nitrogen"] = 600
-    with pytest.raises(ValueError, match="Nitrogen level seems unreasonably high"):
+    with pytest.raises(ValueError, match="nitrogen\n  Input should be less than or equal to 500"):
         SoilAnalysisQuery(**invalid_soil)
 
 
@@ -79,8 +79,8 @@ def test_pest_control_validation():
         "previous_treatments": ["neem_oil"]
     }
     result = PestControlQuery(**valid_pest)
-    assert result.infestation_level["level"] == 3
-    assert "Treatment recommended" in result.infestation_level["description"]
+    assert result.infestation_level == 3
+    assert "Treatment recommended" in result.infestation_description
 
 
 def test_irrigation_schedule_validation():
@@ -114,3 +114,86 @@ def test_harvest_timing_validation():
     invalid_harvest["grain_moisture"] = 20
     with pytest.raises(ValueError, match="Grain moisture too high"):
         HarvestTimingQuery(**invalid_harvest)
+
+
+def test_validation_route_reports_body_errors():
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    with TestClient(app) as client:
+        response = client.post("/api/validate/pest-control", json={
+            "pest_type": "aphids",
+            "infestation_level": 9,
+            "crop_stage": "flowering",
+            "temperature": 25.5,
+            "humidity": 65
+        })
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "infestation_level"]
+
+
+def test_crop_management_batch_keeps_input_order():
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    planting_date = (datetime.now() + timedelta(days=30)).isoformat()
+    wheat = {
+        "crop_type": "wheat",
+        "planting_date": planting_date,
+        "field_size": 10.5,
+        "soil_type": "loam",
+        "climate_zone": "continental"
+    }
+    corn = {
+        **wheat,
+        "crop_type": "corn",
+        "soil_type": "clay_loam",
+        "climate_zone": "humid_subtropical",
+        "irrigation_method": "drip"
+    }
+
+    with TestClient(app) as client:
+        response = client.post(
+            "/api/validate/crop-management/batch", json=[wheat, corn])
+        invalid = client.post(
+            "/api/validate/crop-management/batch",
+            json=[wheat, {**corn, "field_size": 0}])
+
+    assert response.status_code == 200
+    assert [item["recommendations"][1] for item in response.json()] == [
+        "Optimal planting window confirmed for wheat",
+        "Optimal planting window confirmed for corn"
+    ]
+    assert invalid.status_code == 422
+    assert invalid.json()["detail"][0]["loc"] == ["body", 1, "field_size"]
+
+
+def test_soil_analysis_batch_keeps_input_order():
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    acidic = {
+        "ph_level": 5.5,
+        "organic_matter": 3.5,
+        "nitrogen": 150,
+        "phosphorus": 45,
+        "potassium": 200,
+        "soil_moisture": 60
+    }
+    alkaline = {**acidic, "ph_level": 8.0}
+
+    with TestClient(app) as client:
+        response = client.post(
+            "/api/validate/soil-analysis/batch", json=[acidic, alkaline])
+        invalid = client.post(
+            "/api/validate/soil-analysis/batch",
+            json=[acidic, {**alkaline, "nitrogen": 600}])
+
+    assert response.status_code == 200
+    assert [item["recommendations"] for item in response.json()] == [
+        ["Consider lime application to raise soil pH"],
+        ["Consider sulfur application to lower soil pH"]
+    ]
+    assert invalid.status_code == 422
+    assert invalid.json()["detail"][0]["loc"] == ["body", 1, "nitrogen"]
@@ -0,0 +1,48 @@
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main as main
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        lat = float(request.url.params["lat"])
+        return httpx.Response(200, json={
+            "main": {"temp": lat, "humidity": 50},
+            "wind": {"speed": 2.0, "deg": 90},
+            "dt": 1757246400
+        })
+
+    monkeypatch.setattr(main, "create_clients", lambda: httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)))
+    return calls
+
+
+def test_current_weather_batch_dedupes_nearby_locations(upstream):
+    locations = [
+        {"latitude": 41.8781, "longitude": -93.0977},
+        {"latitude": 10.0, "longitude": 20.0},
+        {"latitude": 41.8779, "longitude": -93.0981},
+    ]
+    with TestClient(main.app) as client:
+        response = client.post("/api/weather/current/batch", json=locations)
+
+    assert response.status_code == 200
+    temps = [item["temperature"] for item in response.json()]
+    assert temps == [41.8781, 10.0, 41.8781]
+    assert len(upstream) == 2
+
+
+@pytest.mark.parametrize("location_id", ["not-a-location", "1,2,3", "95.0,10.0"])
+def test_current_weather_rejects_invalid_location(upstream, location_id):
+    with TestClient(main.app) as client:
+        response = client.get(f"/api/weather/current/{location_id}")
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid location format"
+    assert upstream == []
@@ -0,0 +1,37 @@
+import asyncio
+
+import httpx
+
+from models.location import GeoLocation
+from services import weather_service
+from services.weather_service import WeatherService
+
+
+def test_nearby_forecasts_share_one_request_but_keep_their_location(monkeypatch):
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"list": [{
+            "main": {"temp": 20.0, "humidity": 50},
+            "wind": {"speed": 2.0, "deg": 90},
+            "dt": 1757246400
+        }]})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(weather_service, "get_client", lambda: client)
+    service = WeatherService()
+
+    async def run():
+        return await asyncio.gather(
+            service.get_weather_forecast(
+                GeoLocation(latitude=41.8781, longitude=-93.0977), days=1),
+            service.get_weather_forecast(
+                GeoLocation(latitude=41.8779, longitude=-93.0981), days=1))
+
+    first, second = asyncio.run(run())
+    assert len(calls) == 1
+    assert first.location_id == "41.8781,-93.0977"
+    assert second.location_id == "41.8779,-93.0981"
+    assert first.forecast_data == second.forecast_data
@@ -0,0 +1,67 @@
+import asyncio
+from datetime import datetime
+
+from models.weather import WeatherCondition
+from resources.weather_resources import WeatherResources
+
+
+def _weather(temperature: float) -> WeatherCondition:
+    return WeatherCondition(
+        temperature=temperature,
+        humidity=50.0,
+        precipitation=0.0,
+        wind_speed=2.0,
+        wind_direction=90.0,
+        soil_temperature=temperature - 2.0,
+        soil_moisture=40.0,
+        timestamp=datetime(2025, 9, 7, 12, 0)
+    )
+
+
+class FlakyWeatherService:
+    """Fails the first current-weather call, then serves observed data."""
+
+    def __init__(self, failure):
+        self.failure = failure
+        self.calls = 0
+
+    async def get_current_weather(self, location, fallback=True):
+        self.calls += 1
+        if self.calls == 1:
+            if isinstance(self.failure, Exception):
+                raise self.failure
+            return None
+        return _weather(21.5)
+
+    def estimate_current_weather(self, location):
+        return _weather(-40.0)
+
+
+def test_estimated_weather_render_is_not_cached():
+    service = FlakyWeatherService(failure=None)
+    resources = WeatherResources(service)
+
+    async def run():
+        first = await resources.get_current_weather_resource(12.34, 56.78)
+        second = await resources.get_current_weather_resource(12.34, 56.78)
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert "-40.0°C" in first
+    assert "21.5°C" in second
+    assert service.calls == 2
+
+
+def test_error_render_is_not_cached():
+    service = FlakyWeatherService(failure=RuntimeError("upstream down"))
+    resources = WeatherResources(service)
+
+    async def run():
+        first = await resources.get_current_weather_resource(23.45, 67.89)
+        second = await resources.get_current_weather_resource(23.45, 67.89)
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first.startswith("Error retrieving weather data")
+    assert "21.5°C" in second
+    assert service.calls == 2
@@ -0,0 +1,24 @@
+from datetime import datetime
+
+from app.core.models.crop import CropType
+from app.core.models.location import GeoLocation
+from app.core.services.crop_service import CropManagementService
+
+
+class NoCallWeatherService:
+    def __getattr__(self, name):
+        raise AssertionError(f"unexpected weather call: {name}")
+
+
+def test_planting_schedule_makes_no_weather_calls():
+    service = CropManagementService(NoCallWeatherService())
+
+    schedule = service.get_optimal_planting_schedule(
+        CropType.CORN,
+        GeoLocation(latitude=41.8781, longitude=-93.0977),
+        datetime(2026, 9, 1)
+    )
+
+    assert schedule["total_growing_days"] == 172
+    assert schedule["optimal_planting_date"] == datetime(2026, 3, 13)
+    assert schedule["growth_timeline"][0]["start_date"] == datetime(2026, 3, 13)
@@ -0,0 +1,35 @@
+from datetime import datetime
+
+from app.core.models.crop import CropType
+from app.core.models.weather import WeatherCondition
+from app.core.services.knowledge_service import KnowledgeBaseService
+
+
+def _condition(hour: int, temperature: float, humidity: float) -> WeatherCondition:
+    return WeatherCondition(
+        temperature=temperature,
+        humidity=humidity,
+        precipitation=0.0,
+        wind_speed=2.0,
+        wind_direction=90.0,
+        timestamp=datetime(2026, 6, 1, hour)
+    )
+
+
+def test_forecast_disease_risks_count_matching_periods():
+    conditions = [
+        _condition(0, 20.0, 72.0),  # northern leaf blight
+        _condition(3, 28.0, 90.0),  # gray leaf spot
+        _condition(6, 26.0, 72.0),  # northern leaf blight
+    ]
+
+    risks = KnowledgeBaseService().get_forecast_disease_risks(
+        CropType.CORN, conditions)
+
+    assert [
+        (risk["disease"], risk["risk_periods"], risk["first_risk_at"])
+        for risk in risks
+    ] == [
+        ("northern_leaf_blight", 2, datetime(2026, 6, 1, 0)),
+        ("gray_leaf_spot", 1, datetime(2026, 6, 1, 3)),
+    ]
@@ -0,0 +1,36 @@
+import asyncio
+from app.core.services import singleflight
+
+
+def test_concurrent_calls_share_one_fetch():
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    async def run():
+        return await asyncio.gather(
+            *(singleflight.do("key", fetch) for _ in range(10)))
+
+    results = asyncio.run(run())
+    assert calls == 1
+    assert results == [1] * 10
+    assert "key" not in singleflight._inflight
+
+
+def test_errors_propagate_to_all_waiters_and_clear_key():
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("upstream down")
+
+    async def run():
+        return await asyncio.gather(
+            *(singleflight.do("bad", fail) for _ in range(3)),
+            return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, ValueError) for r in results)
+    assert "bad" not in singleflight._inflight
@@ -0,0 +1,101 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.core.models.location import GeoLocation
+from app.core.services.weather_service import WeatherService
+
+
+def test_nearby_current_weather_reuses_cached_result():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json={
+            "main": {"temp": 20.0, "humidity": 50},
+            "wind": {"speed": 2.0, "deg": 90},
+            "dt": 1757246400
+        })
+
+    service = WeatherService(client=httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)))
+
+    async def run():
+        first = await service.get_current_weather(
+            GeoLocation(latitude=41.8781, longitude=-93.0977))
+        second = await service.get_current_weather(
+            GeoLocation(latitude=41.8779, longitude=-93.0981))
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first == second
+    assert len(calls) == 1
+
+
+def test_expired_entry_is_revalidated_with_etag():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, headers={"ETag": '"v1"'}, json={
+            "main": {"temp": 20.0, "humidity": 50},
+            "wind": {"speed": 2.0, "deg": 90},
+            "dt": 1757246400
+        })
+
+    service = WeatherService(client=httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)))
+    location = GeoLocation(latitude=41.8781, longitude=-93.0977)
+
+    async def run():
+        first = await service.get_current_weather(location)
+        service._cache.clear()
+        second = await service.get_current_weather(location)
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first == second
+    assert [c.headers.get("If-None-Match") for c in calls] == [None, '"v1"']
+
+
+def _weather_and_soil_service(soil_status: int, started: list) -> WeatherService:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        started.append(request.url.path)
+        # Hold each reply until both requests are in flight
+        while len(started) < 2:
+            await asyncio.sleep(0)
+        if request.url.path.endswith("/soil"):
+            return httpx.Response(soil_status, json={"moisture": 0.3})
+        return httpx.Response(200, json={
+            "main": {"temp": 20.0, "humidity": 50},
+            "wind": {"speed": 2.0, "deg": 90},
+            "dt": 1757246400
+        })
+
+    return WeatherService(client=httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)))
+
+
+def test_weather_and_soil_are_fetched_concurrently():
+    started = []
+    service = _weather_and_soil_service(200, started)
+    location = GeoLocation(latitude=41.8781, longitude=-93.0977)
+
+    weather, soil = asyncio.run(
+        asyncio.wait_for(service.get_weather_and_soil(location), timeout=1))
+
+    assert sorted(path.rsplit("/", 1)[-1] for path in started) == ["soil", "weather"]
+    assert weather.temperature == 20.0
+    assert soil == {"moisture": 0.3}
+
+
+def test_weather_and_soil_propagates_upstream_errors():
+    service = _weather_and_soil_service(503, [])
+    location = GeoLocation(latitude=41.8781, longitude=-93.0977)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(asyncio.wait_for(
+            service.get_weather_and_soil(location), timeout=1))